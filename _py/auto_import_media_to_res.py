@@ -7,7 +7,7 @@
 #   # or (interactive):
 #   python3 auto_import_media_to_res.py
 
-import os, sys, pathlib, datetime, re
+import os, sys, pathlib, re
 from pathlib import Path
 
 from config_loader import load_config
@@ -157,13 +157,27 @@ def find_subfolder_by_name(parent, name):
             return sub
     return None
 
-def get_or_create_bin_suffix_aware(parent, requested_name: str, base_name: str):
+def index_subfolders(parent) -> dict:
+    """{name: bin} for parent's direct sub-bins, from a single GetSubFolders() call."""
+    index = {}
+    for sub in parent.GetSubFolders().values():
+        index.setdefault(sub.GetName(), sub)  # first match wins, as in find_subfolder_by_name
+    return index
+
+def get_or_create_bin_suffix_aware(parent, requested_name: str, base_name: str, bin_index=None):
     """
     Prefer exact match (requested_name). If not found, try base_name (YYYYMMDD_##).
     If base exists and requested had a suffix, reuse the base (avoid duplicates).
     Otherwise create requested_name.
+    bin_index (from index_subfolders(parent)) replaces the per-lookup Resolve
+    calls and is updated when a bin is created.
     """
-    exact = find_subfolder_by_name(parent, requested_name)
+    def find(name):
+        if bin_index is not None:
+            return bin_index.get(name)
+        return find_subfolder_by_name(parent, name)
+
+    exact = find(requested_name)
     if exact:
         if requested_name != base_name:
             print(f"Using existing bin '{requested_name}' (suffix match).")
@@ -171,7 +185,7 @@ def get_or_create_bin_suffix_aware(parent, requested_name: str, base_name: str):
             print(f"Using existing bin '{requested_name}'.")
         return exact
 
-    base = find_subfolder_by_name(parent, base_name)
+    base = find(base_name)
     if base and requested_name != base_name:
         print(f"No exact bin '{requested_name}', but found base '{base_name}'. Reusing base bin.")
         return base
@@ -180,58 +194,116 @@ def get_or_create_bin_suffix_aware(parent, requested_name: str, base_name: str):
     if not created:
         raise SystemExit(f"Failed to create bin '{requested_name}'.")
     print(f"Created bin '{requested_name}'.")
+    if bin_index is not None:
+        bin_index[requested_name] = created
     return created
 
 VIDEO = {".mov",".mp4",".mxf",".mkv",".m4v",".avi",".r3d",".braw",".ari",".hevc"}
 AUDIO = {".wav",".aif",".aiff",".mp3",".m4a",".flac",".aac",".ogg",".bwf"}
 SEQ   = {".dpx",".exr",".dng",".tif",".tiff",".jpg",".jpeg",".png",".bmp"}
 
+ALL_EXTS = frozenset(VIDEO | AUDIO | SEQ)  # built once; checked for every file
+
+def _scan_recursive(root, recurse=True):
+    """
+    Yield a DirEntry for every file under root (one level only if not recurse).
+    Hidden/metadata names ('.DS_Store', '._CLIP.MOV') are skipped and hidden
+    folders ('.Trashes', '.Spotlight-V100') are not descended into.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.name[0] == ".":
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if recurse:
+                    yield from _scan_recursive(entry.path)
+            elif entry.is_file():
+                yield entry
+
+def _is_media(name: str) -> bool:
+    dot = name.rfind(".")
+    return dot > 0 and name[dot:].lower() in ALL_EXTS
+
 def discover(base, recurse=True):
-    base = pathlib.Path(base)
-    if not base.exists():
+    root = os.path.realpath(base)  # resolve once; entry paths inherit it
+    if not os.path.isdir(root):
         return []
-    it = base.rglob("*") if recurse else base.glob("*")
-    out = []
-    for p in it:
-        if p.is_file() and p.suffix.lower() in (VIDEO | AUDIO | SEQ):
-            out.append(str(p.resolve()))
-    out.sort()
+    out = [e.path for e in _scan_recursive(root, recurse) if _is_media(e.name)]
+    out.sort()  # fixes the timeline clip order
     return out
 
+IMPORT_CHUNK = 500  # paths per AddItemListToMediaPool call
+
+def import_items(media_store, paths):
+    """
+    AddItemListToMediaPool in IMPORT_CHUNK slices (Resolve bogs down on very
+    large lists). Returns all added items, in order.
+    """
+    added = []
+    for i in range(0, len(paths), IMPORT_CHUNK):
+        added += media_store.AddItemListToMediaPool(paths[i:i + IMPORT_CHUNK]) or []
+    return added
+
 # --------- Nested Folder Mode Functions ---------
-def find_media_folders(root_path, include_root=True):
+def walk_media(root) -> dict:
+    """
+    Walk root once; map each directory (root included) to the media files
+    directly inside it. Directories without media are left out. Parents are
+    recorded before their subfolders. Hidden names and folders are skipped
+    as in _scan_recursive.
+    """
+    media = {}
+    exts = ALL_EXTS
+    def visit(d):
+        files, subdirs = [], []
+        with os.scandir(d) as it:
+            for entry in it:
+                name = entry.name
+                if name[0] == ".":
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                dot = name.rfind(".")
+                if dot > 0 and name[dot:].lower() in exts and entry.is_file():
+                    files.append(entry.path)
+        if files:
+            media[d] = files
+        for sub in subdirs:
+            visit(sub)
+    visit(str(root))
+    return media
+
+def find_media_folders(root_path, include_root=True, recursive=False):
     """
     Find all directories (including root) that contain media files.
-    Returns list of (folder_path, relative_path_for_bin) tuples.
+    Returns list of (folder_path, relative_path_for_bin, media_paths) tuples;
+    with recursive, media_paths also covers the folder's subfolders.
     """
-    root = pathlib.Path(root_path)
+    root_str = os.path.realpath(root_path)
+    media = walk_media(root_str)
+
     folders_with_media = []
-    
-    # Check root folder
-    if include_root:
-        root_files = discover(root, recurse=False)  # Only check root level
-        if root_files:
-            folders_with_media.append((root, "."))
-    
-    # Find all subdirectories recursively
-    for subdir in root.rglob("*"):
-        if subdir.is_dir():
-            # Check if this directory contains media files (non-recursive check)
-            dir_files = discover(subdir, recurse=False)
-            if dir_files:
-                # Calculate relative path from root for bin naming
-                try:
-                    rel_path = subdir.relative_to(root)
-                    folders_with_media.append((subdir, str(rel_path)))
-                except ValueError:
-                    # If relative path calculation fails, use absolute path
-                    folders_with_media.append((subdir, str(subdir)))
-    
+    for d, files in media.items():
+        if d == root_str:
+            if not include_root:
+                continue
+            rel_path = "."
+        else:
+            rel_path = os.path.relpath(d, root_str)
+        if recursive:
+            prefix = d + os.sep
+            files = [p for sub, fs in media.items() if sub == d or sub.startswith(prefix) for p in fs]
+        files.sort()  # in place; fixes the timeline clip order
+        folders_with_media.append((pathlib.Path(d), rel_path, files))
+
     return folders_with_media
 
-def process_single_folder(folder_path, bin_name, base_bin_name, media_pool, media_store, root_bin, project, recursive=True):
+def process_single_folder(folder_path, bin_name, base_bin_name, media_pool, media_store, root_bin, project, recursive=True, paths=None, bin_index=None):
     """
     Process a single folder: import media and create timeline.
+    Pass paths (e.g. from find_media_folders) to skip re-scanning the folder,
+    and bin_index (from index_subfolders(root_bin)) to skip bin lookups in Resolve.
     Returns (success: bool, imported_count: int, timeline_name: str, error: str or None)
     """
     try:
@@ -240,16 +312,17 @@ def process_single_folder(folder_path, bin_name, base_bin_name, media_pool, medi
             return False, 0, None, f"Folder does not exist: {folder_path}"
         
         # Discover media files in this folder
-        paths = discover(folder, recurse=recursive)
+        if paths is None:
+            paths = discover(folder, recurse=recursive)
         if not paths:
             return False, 0, None, f"No importable media found in {folder_path!r}"
         
         # Get or create bin
-        target_bin = get_or_create_bin_suffix_aware(root_bin, bin_name, base_bin_name)
+        target_bin = get_or_create_bin_suffix_aware(root_bin, bin_name, base_bin_name, bin_index)
         media_pool.SetCurrentFolder(target_bin)
         
         # Import media
-        added_items = media_store.AddItemListToMediaPool(paths) or []
+        added_items = import_items(media_store, paths)
         imported_count = len(added_items)
         
         if imported_count == 0:
@@ -271,12 +344,15 @@ def process_single_folder(folder_path, bin_name, base_bin_name, media_pool, medi
 if not pathlib.Path(MEDIA).exists():
     raise SystemExit(f"MEDIA path not found: {MEDIA}")
 
+# Names of the root's sub-bins, fetched from Resolve once; bins created below are added to it
+ROOT_BINS = index_subfolders(root_bin)
+
 if NESTED_MODE:
     # Nested folder mode: process each subdirectory separately
     print("=== Nested Folder Mode ===")
     print(f"Scanning for folders with media files in: {MEDIA}")
     
-    folders_to_process = find_media_folders(MEDIA, include_root=True)
+    folders_to_process = find_media_folders(MEDIA, include_root=True, recursive=RECURSIVE)
     
     if not folders_to_process:
         raise SystemExit(f"No folders containing media files found in {MEDIA!r}")
@@ -285,8 +361,9 @@ if NESTED_MODE:
     
     results = []
     failed = []
+    bin_match = BIN_PATTERN.match
     
-    for i, (folder_path, rel_path) in enumerate(folders_to_process, 1):
+    for i, (folder_path, rel_path, media_paths) in enumerate(folders_to_process, 1):
         folder = pathlib.Path(folder_path)
         folder_name = folder.name
         
@@ -299,7 +376,7 @@ if NESTED_MODE:
         
         # Parse bin name for base/suffix (use last component for pattern matching)
         last_component = os.path.basename(bin_name)
-        m = BIN_PATTERN.match(last_component)
+        m = bin_match(last_component)
         base_bin = f"{m.group('ymd')}_{m.group('seq')}" if m else last_component
         
         print(f"[{i}/{len(folders_to_process)}] Processing: {rel_path}")
@@ -308,7 +385,7 @@ if NESTED_MODE:
         
         success, imported_count, timeline_name, error = process_single_folder(
             folder_path, bin_name, base_bin, media_pool, media_store, 
-            root_bin, project, recursive=RECURSIVE
+            root_bin, project, recursive=RECURSIVE, paths=media_paths, bin_index=ROOT_BINS
         )
         
         if success:
@@ -346,14 +423,14 @@ if NESTED_MODE:
 
 else:
     # Original single-folder mode
-    target_bin = get_or_create_bin_suffix_aware(root_bin, BIN, BASE_BIN)
+    target_bin = get_or_create_bin_suffix_aware(root_bin, BIN, BASE_BIN, ROOT_BINS)
     media_pool.SetCurrentFolder(target_bin)
     
     paths = discover(MEDIA, RECURSIVE)
     if not paths:
         raise SystemExit(f"No importable media found in {MEDIA!r} (recursive={RECURSIVE}).")
     
-    added_items = media_store.AddItemListToMediaPool(paths) or []
+    added_items = import_items(media_store, paths)
     imported_count = len(added_items)
     print(f"Imported {imported_count} item(s) into bin '{target_bin.GetName()}'.")
     
@@ -361,7 +438,6 @@ else:
         raise SystemExit("Nothing new was imported, so no timeline was created.")
     
     # --------- Create timeline from the newly imported clips ---------
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     # keep the visible timeline aligned with the folder/bin naming
     timeline_name = f"{target_bin.GetName()}_assembly"
     
@@ -2,6 +2,11 @@ import json
 import os
 from pathlib import Path
 
+try:  # optional faster parser; same result as json.loads
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 
 def load_config(cfg_path=None) -> dict:
     """Load config.json and derive ROOT-based paths for any keys not explicitly set."""
@@ -10,11 +15,11 @@ def load_config(cfg_path=None) -> dict:
         cfg_path = Path(env_path) if env_path else Path(__file__).parent / "config.json"
 
     cfg_path = Path(cfg_path)
-    if not cfg_path.exists():
-        raise SystemExit(f"Config file not found: {cfg_path}")
-
-    with cfg_path.open(encoding="utf-8") as f:
-        cfg = json.load(f)
+    try:
+        with cfg_path.open("rb") as f:
+            cfg = json_loads(f.read())
+    except FileNotFoundError:
+        raise SystemExit(f"Config file not found: {cfg_path}") from None
 
     root = cfg.get("ROOT")
     if root:
@@ -9,6 +9,7 @@ Prompts for user NAME via config.json's user_keymap, then:
 - Ignores hidden/metadata files (names starting with "." or "._")
 - Mirrors the folder structure into PROXY_POOL_ROOT/NAME
 - Creates 1920x1080 H.264 proxies with the SAME filename as the source
+  (VideoToolbox hardware encoder on macOS when ffmpeg has it, else libx264)
 - Skips outputs that already exist AND are newer than the source
 - Writes a CSV report of proxies generated in PROXY_POOL_ROOT/NAME/_reports/
 
@@ -18,19 +19,42 @@ Config (JSON) expected keys:
   user_keymap { letter: NAME }
 Optional env:
   CONFIG_PATH -> path to config.json (default: /Volumes/LaCie/_scripts/config.json)
+Options:
+  --jobs N -> number of concurrent ffmpeg encodes
+              (default: CPU count / ENCODE_THREADS; 1 = serial with progress bars)
+  -y/--yes -> skip the "Proceed?" confirmation prompts
 """
 
 import os
 import sys
-import csv
+import stat
+import time
+import fcntl
+import shutil
+import struct
+import argparse
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime
 
 from config_loader import load_config
 
 VIDEO_EXTS = {".mp4"}  # extend if needed: {".mp4", ".mov", ...}
+ENCODE_THREADS = 2     # ffmpeg threads per encode when several run at once
+SMALL_CLIP_BYTES = 200 * 1024 * 1024  # clips below this are batched into one ffmpeg run
+BATCH_SIZE = 8                        # max clips per batched ffmpeg run
+HW_BATCH_SIZE = 2                     # same, on VideoToolbox (hardware encode sessions are scarce)
+# Absolute tool paths + close_fds=False let subprocess use posix_spawn instead of
+# fork+exec (our fds are non-inheritable anyway), which is cheaper from a big parent.
+FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+FFPROBE = shutil.which("ffprobe") or "ffprobe"
+PREFETCH_BYTES = 64 * 1024 * 1024  # head of the next source warmed while one encodes
+# macOS <sys/fcntl.h>: fcntl(F_RDADVISE) with a struct radvisory
+F_RDADVISE = getattr(fcntl, "F_RDADVISE", 44)
+SCAN_WORKERS = 16      # top-level source folders walked at once (hides mount latency)
+_STOP = threading.Event()  # set on Ctrl-C: queued/retried encodes must not start
 
 # ---------------- Utilities ----------------
 def die(msg: str, code: int = 1):
@@ -61,75 +85,125 @@ def pretty_size(num_bytes: int) -> str:
         i += 1
     return f"{size:.1f}{units[i]}"
 
-def newer_than(src: Path, dst: Path) -> bool:
+def newer_than(src_stat: os.stat_result, dst_stat: Optional[os.stat_result]) -> bool:
     """True if src is newer than dst, or dst missing."""
-    try:
-        return src.stat().st_mtime > dst.stat().st_mtime
-    except FileNotFoundError:
-        return True
+    return dst_stat is None or src_stat.st_mtime > dst_stat.st_mtime
 
-def find_existing_proxy(src: Path, dst_root: Path, src_root: Path) -> Optional[Path]:
+def index_existing_proxies(dst_root: Path) -> Dict[str, os.stat_result]:
+    """
+    Walk the user's proxy pool once and map each proxy's path (relative to the
+    pool, or to its _sent bucket) to its stat. Since proxy_packager.py creates
+    hard links at the folder level, relative paths are preserved inside each
+    _sent/<bucket>. The original location wins over _sent copies.
+    """
+    index: Dict[str, os.stat_result] = {}
+
+    def walk(dirpath: str, rel: str, skip_sent: bool):
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            return
+        subdirs = []
+        with it:
+            for entry in it:
+                name = entry.name
+                if name[0] == ".":
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if not (skip_sent and name == "_sent"):
+                        subdirs.append((entry.path, rel + name + os.sep))
+                elif os.path.splitext(name)[1].lower() in VIDEO_EXTS and rel + name not in index:
+                    try:
+                        index[rel + name] = entry.stat()
+                    except OSError:
+                        pass
+        for sub, sub_rel in subdirs:
+            walk(sub, sub_rel, False)
+
+    walk(str(dst_root), "", True)
+    try:
+        with os.scandir(dst_root / "_sent") as it:
+            buckets = [e.path for e in it if e.is_dir()]
+    except OSError:
+        buckets = []
+    for bucket in buckets:
+        walk(bucket, "", False)
+    return index
+
+def _is_video(name: str) -> bool:
+    return name[0] != "." and name[name.rfind("."):].lower() in VIDEO_EXTS
+
+def _walk_videos(top: str) -> List[Tuple[Path, os.stat_result]]:
     """
-    Find existing proxy file in either original location or _sent directories.
-    Since proxy_packager.py creates hard links at the folder level, we need to
-    check both the original location and all _sent buckets.
-    Returns the path to the existing proxy, or None if not found.
+    (path, stat) for every video under top. os.fwalk keeps each directory open,
+    so each stat is a single lookup relative to it rather than a full path walk.
     """
-    rel = src.relative_to(src_root)
-    original_proxy = dst_root / rel.parent / src.name
-    
-    # Check original location first (fast path)
-    if original_proxy.exists():
-        return original_proxy
-    
-    # Check _sent directory recursively
-    # Since proxy_packager.py hard-links entire folders, the relative path
-    # structure should be preserved within each bucket
-    sent_dir = dst_root / "_sent"
-    if sent_dir.exists():
-        for sent_bucket in sent_dir.iterdir():
-            if not sent_bucket.is_dir():
+    found: List[Tuple[Path, os.stat_result]] = []
+    for dirpath, dirnames, filenames, dfd in os.fwalk(top):
+        dirnames[:] = [d for d in dirnames if d[0] != "."]
+        for name in filenames:
+            if not _is_video(name):
+                continue
+            try:
+                st = os.stat(name, dir_fd=dfd)
+            except OSError:
                 continue
-            # Construct the path within this bucket
-            sent_proxy = sent_bucket / rel.parent / src.name
-            if sent_proxy.exists():
-                return sent_proxy
-    
-    return None
-
-def is_hidden_or_metadata(p: Path) -> bool:
+            if stat.S_ISREG(st.st_mode):
+                found.append((Path(dirpath, name), st))
+    return found
+
+def discover_sources(src_root: Path, show_progress: bool = False) -> List[Tuple[Path, os.stat_result]]:
     """
-    Treat as hidden/metadata if:
-      - the filename starts with '.' (e.g., .DS_Store)
-      - the filename starts with '._' (AppleDouble sidecar like ._C0454.MP4)
-      - ANY parent directory starts with '.'
+    (path, stat) for the video files under src_root. Names starting with '.'
+    (.DS_Store, AppleDouble '._' sidecars) are skipped, and hidden folders
+    (.Trashes, .Spotlight-V100, …) are never descended into. Top-level
+    folders are walked concurrently; show_progress keeps a running count
+    on one line while they finish.
     """
-    if p.name.startswith(".") or p.name.startswith("._"):
-        return True
-    return any(part.startswith(".") for part in p.parts)
-
-def discover_sources(src_root: Path) -> List[Path]:
-    files: List[Path] = []
-    for p in src_root.rglob("*"):
-        if not p.is_file():
-            continue
-        if is_hidden_or_metadata(p):
-            continue
-        if p.suffix.lower() in VIDEO_EXTS:
-            files.append(p)
-    return files
+    found: List[Tuple[Path, os.stat_result]] = []
+    subdirs: List[str] = []
+    with os.scandir(src_root) as it:
+        for entry in it:
+            if entry.name[0] == ".":
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif _is_video(entry.name) and entry.is_file():
+                try:
+                    found.append((Path(entry.path), entry.stat()))
+                except OSError:
+                    pass
+
+    def report(n: int):
+        if show_progress:
+            sys.stdout.write(f"\r\x1b[K  {n}/{len(subdirs)} folder(s) scanned, {len(found)} video file(s)…")
+            sys.stdout.flush()
+
+    if len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(subdirs))) as ex:
+            for n, part in enumerate(ex.map(_walk_videos, subdirs), 1):
+                found += part
+                report(n)
+    else:
+        for n, d in enumerate(subdirs, 1):
+            found += _walk_videos(d)
+            report(n)
+    if show_progress and subdirs:
+        sys.stdout.write("\r\x1b[K")
+        sys.stdout.flush()
+    return found
 
 # ---------------- Progress display ----------------
 def get_duration_seconds(input_path: Path) -> Optional[float]:
     """Get video duration in seconds using ffprobe."""
     cmd = [
-        "ffprobe", "-v", "error",
+        FFPROBE, "-v", "error",
         "-show_entries", "format=duration",
         "-of", "default=noprint_wrappers=1:nokey=1",
         str(input_path)
     ]
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True, close_fds=False)
         return float(result.stdout.strip())
     except (subprocess.CalledProcessError, ValueError):
         return None
@@ -169,49 +243,123 @@ def finish_progress():
     sys.stdout.flush()
 
 # ---------------- Encoding ----------------
-def run_ffmpeg(input_path: Path, output_path: Path, task_idx: int = 0, total_tasks: int = 0):
+def prefetch_source(path: Path):
+    """
+    Hint the OS to start reading the head of path into cache, so the next
+    encode doesn't begin with a cold seek on the LaCie. Best effort.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, PREFETCH_BYTES, os.POSIX_FADV_WILLNEED)
+        elif sys.platform == "darwin":
+            fcntl.fcntl(fd, F_RDADVISE, struct.pack("@qi4x", 0, PREFETCH_BYTES))
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+# Very compatible H.264 (software)
+X264_ARGS = [
+    "-c:v", "libx264",
+    "-pix_fmt", "yuv420p",
+    "-profile:v", "high",
+    "-level:v", "4.1",
+
+    # Size/speed tradeoff
+    "-preset", "fast",
+    "-crf", "23",
+]
+
+# Same H.264 profile on Apple's hardware encoder; 6 Mb/s ~ CRF 23 for 1080p proxies
+VIDEOTOOLBOX_ARGS = [
+    "-c:v", "h264_videotoolbox",
+    "-pix_fmt", "yuv420p",
+    "-profile:v", "high",
+    "-b:v", "6M",
+]
+
+def has_videotoolbox() -> bool:
+    """True on macOS when this ffmpeg build lists the h264_videotoolbox encoder."""
+    if sys.platform != "darwin":
+        return False
+    try:
+        result = subprocess.run([FFMPEG, "-hide_banner", "-encoders"],
+                                capture_output=True, text=True, close_fds=False)
+    except OSError:
+        return False
+    return result.returncode == 0 and "h264_videotoolbox" in result.stdout
+
+_ENCODE_ARGS: Optional[List[str]] = None
+
+def encode_args() -> List[str]:
+    """Per-output encode settings shared by single and batched ffmpeg runs (encoder probed once)."""
+    global _ENCODE_ARGS
+    if _ENCODE_ARGS is None:
+        video = VIDEOTOOLBOX_ARGS if has_videotoolbox() else X264_ARGS
+        _ENCODE_ARGS = [
+            # Scale to fit within 1920x1080 (preserve AR), pad to exact 1920x1080, force square pixels
+            "-vf", "scale=1920:1080:flags=lanczos:force_original_aspect_ratio=decrease,"
+                   "pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1",
+        ] + video + [
+            # Audio: AAC LC @48k
+            "-c:a", "aac",
+            "-b:a", "128k",
+            "-ar", "48000",
+
+            # Put moov atom at start for Quick Look / progressive playback
+            "-movflags", "+faststart",
+        ]
+    return _ENCODE_ARGS
+
+def default_jobs() -> int:
+    return max(1, (os.cpu_count() or 1) // ENCODE_THREADS)
+
+def run_ffmpeg(input_path: Path, output_path: Path, task_idx: int = 0, total_tasks: int = 0,
+               progress: bool = True, threads: Optional[int] = None):
     """
     Downscale to 1080p, encode H.264 (AVC) with Apple/Quick Look–friendly settings.
     Keeps aspect ratio and letterboxes/pillarboxes to exactly 1920x1080.
-    Shows a two-line progress bar for the current file and overall batch.
+    Shows a two-line progress bar for the current file and overall batch unless
+    progress is False (used when several encodes run concurrently).
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    duration = get_duration_seconds(input_path)
+    duration = get_duration_seconds(input_path) if progress else None
 
     cmd = [
-        "ffmpeg", "-y",
+        FFMPEG, "-y",
         "-loglevel", "warning",
         "-nostats",
         "-i", str(input_path),
 
-        # Scale to fit within 1920x1080 (preserve AR), pad to exact 1920x1080, force square pixels
-        "-vf", "scale=1920:1080:flags=lanczos:force_original_aspect_ratio=decrease,"
-               "pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1",
-
-        # Very compatible H.264
-        "-c:v", "libx264",
-        "-pix_fmt", "yuv420p",
-        "-profile:v", "high",
-        "-level:v", "4.1",
-
-        # Size/speed tradeoff
-        "-preset", "fast",
-        "-crf", "23",
-
-        # Audio: AAC LC @48k
-        "-c:a", "aac",
-        "-b:a", "128k",
-        "-ar", "48000",
-
-        # Put moov atom at start for Quick Look / progressive playback
-        "-movflags", "+faststart",
-
-        # Structured progress output on stdout
-        "-progress", "pipe:1",
-
-        str(output_path)
-    ]
+    ] + encode_args()
+    if threads:
+        cmd += ["-threads", str(threads)]
+
+    if not progress:
+        cmd.append(str(output_path))
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            close_fds=False
+        )
+        _, stderr_output = process.communicate()
+        if process.returncode != 0:
+            print(f"❌ ffmpeg error output:\n{stderr_output}", file=sys.stderr)
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+        print(f"✅ Proxy created: {output_path}")
+        return
+
+    # Structured progress output on stdout
+    cmd += ["-progress", "pipe:1", str(output_path)]
 
     process = subprocess.Popen(
         cmd,
@@ -219,7 +367,8 @@ def run_ffmpeg(input_path: Path, output_path: Path, task_idx: int = 0, total_tas
         stderr=subprocess.PIPE,
         text=True,
         encoding='utf-8',
-        errors='replace'
+        errors='replace',
+        close_fds=False
     )
 
     current_time_us = 0
@@ -263,6 +412,143 @@ def run_ffmpeg(input_path: Path, output_path: Path, task_idx: int = 0, total_tas
 
     print(f"✅ Proxy created: {output_path}")
 
+def run_ffmpeg_batch(pairs: List[Tuple[Path, Path]], threads: Optional[int] = None):
+    """
+    Encode several short clips in ONE ffmpeg process (one input -> one output
+    each, same settings as run_ffmpeg) so process and codec start-up is paid
+    once per batch instead of once per clip. Raises CalledProcessError if any
+    output fails; the caller then retries the clips one by one.
+    """
+    cmd = [FFMPEG, "-y", "-loglevel", "warning", "-nostats"]
+    for src, _ in pairs:
+        cmd += ["-i", str(src)]
+    for i, (_, out) in enumerate(pairs):
+        out.parent.mkdir(parents=True, exist_ok=True)
+        cmd += ["-map", f"{i}:v:0", "-map", f"{i}:a:0?"] + encode_args()
+        if threads:
+            cmd += ["-threads", str(threads)]
+        cmd.append(str(out))
+
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        close_fds=False
+    )
+    _, stderr_output = process.communicate()
+    if process.returncode != 0:
+        print(f"❌ ffmpeg error output:\n{stderr_output}", file=sys.stderr)
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+    for _, out in pairs:
+        print(f"✅ Proxy created: {out}")
+
+def group_tasks(tasks: List[Tuple[Path, Path, int]], jobs: int = 1) -> List[List[Tuple[Path, Path]]]:
+    """
+    Split tasks into ffmpeg runs: large clips alone, short clips up to
+    BATCH_SIZE (HW_BATCH_SIZE on VideoToolbox) at a time (fewer if needed to keep all jobs workers busy).
+    """
+    limit = HW_BATCH_SIZE if "h264_videotoolbox" in encode_args() else BATCH_SIZE
+    batches: List[List[Tuple[Path, Path]]] = []
+    small: List[Tuple[Path, Path]] = []
+    for src, out, size in tasks:
+        if size < SMALL_CLIP_BYTES:
+            small.append((src, out))
+        else:
+            batches.append([(src, out)])
+    size = max(1, min(limit, -(-len(small) // jobs)))
+    for i in range(0, len(small), size):
+        batches.append(small[i:i + size])
+    return batches
+
+def encode_batch(batch: List[Tuple[Path, Path]], threads: Optional[int] = None) -> Tuple[List[Tuple[str, str]], int]:
+    """Encode one batch without progress bars. Returns (generated, error_count)."""
+    if _STOP.is_set():
+        return [], 0
+    if len(batch) > 1:
+        try:
+            run_ffmpeg_batch(batch, threads=threads)
+            return [(str(src), str(out)) for src, out in batch], 0
+        except subprocess.CalledProcessError:
+            if _STOP.is_set():  # killed by Ctrl-C, not a bad clip
+                return [], 0
+            print(f"⚠️  Batched run of {len(batch)} clip(s) failed; retrying them one by one.")
+
+    generated: List[Tuple[str, str]] = []
+    errors = 0
+    for src, out in batch:
+        if _STOP.is_set():
+            break
+        try:
+            run_ffmpeg(src, out, progress=False, threads=threads)
+            generated.append((str(src), str(out)))
+        except subprocess.CalledProcessError as e:
+            errors += 1
+            print(f"❌ ffmpeg failed for {src} (exit {e.returncode})")
+    return generated, errors
+
+class EncodeSlots:
+    """
+    Counting semaphore in clips rather than ffmpeg runs. A batch encodes all
+    its clips at once, so it holds one slot per clip (capped at the total,
+    with its threads spread over the clips): the pool never runs more than
+    `total` x ENCODE_THREADS encoder threads, which is what default_jobs()
+    sizes for.
+    """
+    def __init__(self, total: int):
+        self.total = total
+        self.free = total
+        self._cv = threading.Condition()
+
+    def acquire(self, n: int) -> int:
+        n = min(n, self.total)
+        with self._cv:
+            self._cv.wait_for(lambda: self.free >= n)
+            self.free -= n
+        return n
+
+    def release(self, n: int):
+        with self._cv:
+            self.free += n
+            self._cv.notify_all()
+
+# ---------------- Report ----------------
+_CSV_SPECIAL = str.maketrans("", "", ',"\r\n')  # chars that force csv quoting
+
+class ProxyReport:
+    """
+    CSV of generated proxies, created on the first row and appended to as
+    encodes finish, so an interrupted run still leaves a partial report.
+    Plain paths are written directly; only rows that need quoting go
+    through csv.writer.
+    """
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows = 0
+        self._f = None
+        self._w = None
+
+    def add(self, rows: List[Tuple[str, str]]):
+        for src, out in rows:
+            if self._f is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._f = self.path.open("w", newline="", buffering=1 << 20)
+                self._f.write("source_path,proxy_path\r\n")
+            if len(src.translate(_CSV_SPECIAL)) == len(src) and len(out.translate(_CSV_SPECIAL)) == len(out):
+                self._f.write(f"{src},{out}\r\n")
+            else:
+                if self._w is None:
+                    import csv  # only needed for the rare path that must be quoted
+                    self._w = csv.writer(self._f)
+                self._w.writerow((src, out))
+            self.rows += 1
+
+    def close(self):
+        if self._f is not None:
+            self._f.close()
+
 # ---------------- All-users snapshot ----------------
 
 def snapshot_all_users(media_pool_root: Path, proxy_pool_root: Path, keymap: dict):
@@ -273,7 +559,7 @@ def snapshot_all_users(media_pool_root: Path, proxy_pool_root: Path, keymap: dic
     out_dir = Path(__file__).parent.parent / "data" / "output" / "missing_proxies"
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ts = time.strftime("%Y%m%d_%H%M%S")
     missing_csv_path = out_dir / f"{ts}_missing_proxies.csv"
 
     names = list(dict.fromkeys(keymap.values()))  # dedupe, preserve order
@@ -287,13 +573,17 @@ def snapshot_all_users(media_pool_root: Path, proxy_pool_root: Path, keymap: dic
         if not src_root.exists():
             continue
 
-        for p in discover_sources(src_root):
-            existing_proxy = find_existing_proxy(p, dst_root, src_root)
-            if existing_proxy is None or newer_than(p, existing_proxy):
-                rel = str(p.relative_to(src_root))
-                expected = str(dst_root / p.relative_to(src_root).parent / p.name)
-                all_missing_rows.append((name, rel, str(p), expected))
-
+        proxy_index = index_existing_proxies(dst_root)
+        src_files = discover_sources(src_root)
+        cut = len(str(src_root)) + 1   # strip "<src_root>/" to get the relative path
+        dst_str = str(dst_root)
+        for p, src_stat in src_files:
+            src_str = str(p)
+            rel = src_str[cut:]
+            if newer_than(src_stat, proxy_index.get(rel)):
+                all_missing_rows.append((name, rel, src_str, os.path.join(dst_str, rel)))
+
+    import csv  # deferred: only the snapshot path needs it at all
     with missing_csv_path.open("w", newline="") as f:
         w = csv.writer(f)
         w.writerow(["user", "relative_path", "media_full_path", "expected_proxy_path"])
@@ -306,7 +596,8 @@ def snapshot_all_users(media_pool_root: Path, proxy_pool_root: Path, keymap: dic
 
 # ---------------- Per-user encode ----------------
 
-def encode_user(NAME: str, media_pool_root: Path, proxy_pool_root: Path, ask_confirm: bool = True):
+def encode_user(NAME: str, media_pool_root: Path, proxy_pool_root: Path, ask_confirm: bool = True,
+                jobs: int = 1):
     """Scan, plan, and encode proxies for a single user. Returns (generated_count, error_count)."""
     src_root = media_pool_root / NAME
     dst_root = proxy_pool_root / NAME
@@ -321,28 +612,27 @@ def encode_user(NAME: str, media_pool_root: Path, proxy_pool_root: Path, ask_con
     print(f"User:           {NAME}")
     print(f"Source (media): {src_root}")
     print(f"Dest (proxies): {dst_root}")
+    args = encode_args()
+    print(f"Encoder:        {args[args.index('-c:v') + 1]}")
     print("Scanning for video files…")
 
-    src_files: List[Path] = discover_sources(src_root)
+    src_files = discover_sources(src_root, show_progress=True)
     if not src_files:
         print("No matching files found under the user's media pool. Nothing to do.")
         return 0, 0
 
-    tasks: List[Tuple[Path, Path]] = []
+    proxy_index = index_existing_proxies(dst_root)
+    tasks: List[Tuple[Path, Path, int]] = []
     total_size = 0
-    for src in src_files:
-        rel = src.relative_to(src_root)
-        out = dst_root / rel.parent / src.name
+    cut = len(str(src_root)) + 1   # strip "<src_root>/" to get the relative path
+    for src, src_stat in src_files:
+        rel = str(src)[cut:]
 
-        existing_proxy = find_existing_proxy(src, dst_root, src_root)
-        if existing_proxy and not newer_than(src, existing_proxy):
+        if not newer_than(src_stat, proxy_index.get(rel)):
             continue
 
-        tasks.append((src, out))
-        try:
-            total_size += src.stat().st_size
-        except FileNotFoundError:
-            pass
+        tasks.append((src, dst_root / rel, src_stat.st_size))
+        total_size += src_stat.st_size
 
     print(f"Found {len(src_files)} source file(s).")
     print(f"Planned {len(tasks)} encode(s). Estimated input size: {pretty_size(total_size)}")
@@ -355,28 +645,60 @@ def encode_user(NAME: str, media_pool_root: Path, proxy_pool_root: Path, ask_con
         if proceed not in ("", "y", "yes"):
             die("Aborted by user.", code=0)
 
-    generated: List[Tuple[str, str]] = []
+    ts = time.strftime("%Y%m%d_%H%M%S")
+    report = ProxyReport(dst_root / "_reports" / f"proxies_{ts}.csv")
     errors = 0
-    for i, (src, out) in enumerate(tasks, 1):
-        print(f"\n⏳ [{i}/{len(tasks)}] Encoding: {src.name}")
-        try:
-            run_ffmpeg(src, out, task_idx=i, total_tasks=len(tasks))
-            generated.append((str(src), str(out)))
-        except subprocess.CalledProcessError as e:
-            errors += 1
-            print(f"❌ ffmpeg failed for {src} (exit {e.returncode})")
-
-    reports_dir = dst_root / "_reports"
-    reports_dir.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    csv_path = reports_dir / f"proxies_{ts}.csv"
-
-    if generated:
-        with csv_path.open("w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["source_path", "proxy_path"])
-            w.writerows(generated)
-        print(f"\n📝 Report written: {csv_path}")
+    batches = group_tasks(tasks, jobs)
+    slots = EncodeSlots(jobs)
+    jobs = min(jobs, len(batches))
+    try:
+        if jobs <= 1:
+            for i, batch in enumerate(batches, 1):
+                if i < len(batches):
+                    prefetch_source(batches[i][0][0])  # warm the next clip while this one encodes
+                if len(batch) > 1:
+                    print(f"\n⏳ [{i}/{len(batches)}] Encoding {len(batch)} short clips in one ffmpeg run…")
+                    gen, err = encode_batch(batch)
+                    report.add(gen)
+                    errors += err
+                    continue
+                src, out = batch[0]
+                print(f"\n⏳ [{i}/{len(batches)}] Encoding: {src.name}")
+                try:
+                    run_ffmpeg(src, out, task_idx=i, total_tasks=len(batches))
+                    report.add([(str(src), str(out))])
+                except subprocess.CalledProcessError as e:
+                    errors += 1
+                    print(f"❌ ffmpeg failed for {src} (exit {e.returncode})")
+        else:
+            # ffmpeg does the work in its own process; threads just wait on it
+            def run_batch(batch):
+                n = slots.acquire(len(batch))
+                try:
+                    # a batch wider than the whole pool shares its slots' threads
+                    return encode_batch(batch, max(1, ENCODE_THREADS * n // len(batch)))
+                finally:
+                    slots.release(n)
+
+            print(f"\n⏳ Encoding {len(tasks)} file(s) in {len(batches)} ffmpeg run(s), up to {slots.total} clip(s) at a time…")
+            with ThreadPoolExecutor(max_workers=jobs) as ex:
+                futures = [ex.submit(run_batch, batch) for batch in batches]
+                try:
+                    for i, fut in enumerate(as_completed(futures), 1):
+                        gen, err = fut.result()
+                        report.add(gen)
+                        errors += err
+                        print(f"   [{i}/{len(batches)}] done")
+                except BaseException:
+                    # Ctrl-C also hits the running ffmpegs; drop the queue and their retries
+                    _STOP.set()
+                    ex.shutdown(wait=True, cancel_futures=True)
+                    raise
+    finally:
+        report.close()
+
+    if report.rows:
+        print(f"\n📝 Report written: {report.path}")
     else:
         print("\n(No new proxies were generated; no CSV report written.)")
 
@@ -385,11 +707,27 @@ def encode_user(NAME: str, media_pool_root: Path, proxy_pool_root: Path, ask_con
     else:
         print("\n🎬 All proxies generated successfully.")
 
-    return len(generated), errors
+    return report.rows, errors
 
 
 # ---------------- Main ----------------
 def main():
+    parser = argparse.ArgumentParser(description="Create 1080p H.264 proxies for a user's media pool")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Number of concurrent ffmpeg encodes (default: CPU count / %d). 1 shows per-file progress." % ENCODE_THREADS
+    )
+    parser.add_argument(
+        "-y", "--yes",
+        action="store_true",
+        help="Start encoding right after planning, without the Proceed? prompts."
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        die("--jobs must be at least 1.")
+
     cfg = load_config()
 
     if "MEDIA_POOL_ROOT" not in cfg:
@@ -413,20 +751,21 @@ def main():
 
     if NAME == "ALL":
         snapshot_all_users(media_pool_root, proxy_pool_root, keymap)
-        proceed = input("\nProceed with encoding all missing proxies? [y/N]: ").strip().lower()
-        if proceed not in ("y", "yes"):
-            die("Aborted.", code=0)
+        if not args.yes:
+            proceed = input("\nProceed with encoding all missing proxies? [y/N]: ").strip().lower()
+            if proceed not in ("y", "yes"):
+                die("Aborted.", code=0)
         names_to_process = list(dict.fromkeys(keymap.values()))
         total_generated = 0
         total_errors = 0
         for name in names_to_process:
-            gen, err = encode_user(name, media_pool_root, proxy_pool_root, ask_confirm=False)
+            gen, err = encode_user(name, media_pool_root, proxy_pool_root, ask_confirm=False, jobs=args.jobs)
             total_generated += gen
             total_errors += err
         print(f"\n{'='*50}")
         print(f"All users complete. Generated: {total_generated}  Errors: {total_errors}")
     else:
-        encode_user(NAME, media_pool_root, proxy_pool_root, ask_confirm=True)
+        encode_user(NAME, media_pool_root, proxy_pool_root, ask_confirm=not args.yes, jobs=args.jobs)
 
 if __name__ == "__main__":
     main()
@@ -1,16 +1,21 @@
 #!/usr/bin/env python3
 import argparse
+import errno
+import fcntl
 import os
-import re
-import shutil
+import stat
 import sys
-import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
 from config_loader import load_config
 
+if TYPE_CHECKING:
+    import subprocess  # annotations only; imported on first use at runtime
+
 # ------------------------ Helpers ------------------------
 
 def die(msg: str, code: int = 1):
@@ -28,36 +33,33 @@ def choose_user(user_keymap: dict) -> str:
         die(f"Invalid choice '{choice}'.")
     return user_keymap[choice]
 
-def list_top_level_dirs(base: Path, exclude_names: List[str]) -> List[Path]:
-    if not base.exists():
+def list_top_level_dirs(base: Path, exclude_names: Set[str]) -> List[Path]:
+    """Non-hidden subdirectories of base (by readdir type, no stat per entry), sorted case-insensitively."""
+    try:
+        with os.scandir(base) as it:
+            dirs = [Path(e.path) for e in it
+                    if e.name[0] != "." and e.name not in exclude_names
+                    and e.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
         die(f"Base directory does not exist: {base}")
-    dirs = []
-    for p in base.iterdir():
-        if p.is_dir():
-            name = p.name
-            if name in exclude_names:
-                continue
-            if name.startswith("."):
-                continue
-            dirs.append(p)
     return sorted(dirs, key=lambda x: x.name.lower())
 
 def next_today_bucket(sent_dir: Path) -> Tuple[str, Path]:
     """Return (bucket_name, bucket_path) for today's YYYYMMDD_## where ## = max+1 or 01."""
     today_str = datetime.now().strftime("%Y%m%d")
-    pattern = re.compile(rf"^{today_str}_(\d{{2}})$")
+    prefix = today_str + "_"
     max_idx = 0
-    if sent_dir.exists():
-        for p in sent_dir.iterdir():
-            if p.is_dir():
-                m = pattern.match(p.name)
-                if m:
-                    try:
-                        idx = int(m.group(1))
-                        if idx > max_idx:
-                            max_idx = idx
-                    except ValueError:
-                        pass
+    try:
+        with os.scandir(sent_dir) as it:
+            for e in it:
+                n = e.name
+                if len(n) == 11 and n.startswith(prefix) and n[9:].isascii() and n[9:].isdigit() \
+                        and e.is_dir(follow_symlinks=False):
+                    idx = int(n[9:])
+                    if idx > max_idx:
+                        max_idx = idx
+    except FileNotFoundError:
+        pass
     next_idx = max_idx + 1
     bucket_name = f"{today_str}_{next_idx:02d}"
     return bucket_name, sent_dir / bucket_name
@@ -65,60 +67,94 @@ def next_today_bucket(sent_dir: Path) -> Tuple[str, Path]:
 def ensure_dir(path: Path):
     path.mkdir(parents=True, exist_ok=True)
 
-def unique_destination(dst_dir: Path, name: str) -> Path:
-    """Return a non-colliding path under dst_dir for folder 'name' (append -1, -2, ... if needed)."""
-    candidate = dst_dir / name
-    if not candidate.exists():
-        return candidate
-    i = 1
-    while True:
-        alt = dst_dir / f"{name}-{i}"
-        if not alt.exists():
-            return alt
+def unique_destination(dst_dir: Path, name: str, taken: Optional[Set[str]] = None) -> Path:
+    """
+    Return a non-colliding path under dst_dir for folder 'name' (append -1, -2, ... if needed).
+    taken is the set of names in dst_dir (listed once here if not given); the
+    chosen name is added to it, so one set can serve a run of reservations.
+    """
+    if taken is None:
+        try:
+            taken = set(os.listdir(dst_dir))
+        except FileNotFoundError:
+            taken = set()
+    candidate = name
+    i = 0
+    while candidate in taken:
         i += 1
+        candidate = f"{name}-{i}"
+    taken.add(candidate)
+    return dst_dir / candidate
+
+_OPEN = None    # path of `open`, resolved on first use rather than per call
+
+def _open(*args: str) -> "subprocess.Popen":
+    """Launch `open` without waiting for it, so several can overlap."""
+    global _OPEN
+    import subprocess
+    if _OPEN is None:
+        import shutil
+        _OPEN = shutil.which("open") or "open"
+    return subprocess.Popen([_OPEN, *args])
 
-def open_finder(path: Path):
+def open_finder(path: Path) -> Optional["subprocess.Popen"]:
     try:
-        subprocess.run(["open", str(path)], check=False)
+        return _open(str(path))
     except Exception as e:
         print(f"[WARN] Could not open Finder at {path}: {e}")
+        return None
 
-def reveal_in_finder(target: Path):
+def reveal_in_finder(target: Path) -> Optional["subprocess.Popen"]:
     """
     Open Finder and select the given file/folder.
     Works for directories too (Finder will open the parent and highlight it).
     """
     try:
-        subprocess.run(["open", "-R", str(target)], check=False)
+        return _open("-R", str(target))
     except Exception as e:
         print(f"[WARN] Could not reveal in Finder: {e}")
         # Fallback: just open the parent folder
         try:
-            subprocess.run(["open", str(target.parent if target.exists() else target)], check=False)
+            return _open(str(target.parent if target.exists() else target))
         except Exception as e2:
             print(f"[WARN] Fallback open failed: {e2}")
+            return None
 
-def open_safari(url: str):
+def open_safari(url: str) -> Optional["subprocess.Popen"]:
     try:
-        subprocess.run(["open", "-a", "Safari", url], check=False)
+        return _open("-a", "Safari", url)
     except Exception:
-        subprocess.run(["open", url], check=False)
+        try:
+            return _open(url)
+        except Exception as e:
+            print(f"[WARN] Could not open {url}: {e}")
+            return None
 
-def folder_already_sent(sent_dir: Path, folder_name: str) -> bool:
+def open_finder_and_request(folder: Path, url: Optional[str], name: str):
+    """Open Finder at folder and Safari at the File Request URL concurrently."""
+    procs = [open_safari(url)] if url else []
+    if not url:
+        print(f"[INFO] No file_request_urls entry for {name}. Add it to config.json to auto-open Dropbox.")
+    procs.append(open_finder(folder))
+    for p in procs:
+        if p is not None:
+            p.wait()
+
+def build_sent_index(sent_dir: Path) -> set:
     """
-    Check if a folder has already been sent by looking in all _sent buckets.
-    Returns True if the folder exists in any bucket.
+    Names of everything already sent, across all _sent buckets, from one
+    listing per bucket (so each candidate check is a set lookup).
     """
-    if not sent_dir.exists():
-        return False
-    
-    for bucket in sent_dir.iterdir():
-        if not bucket.is_dir():
-            continue
-        # Check if this folder exists in this bucket
-        if (bucket / folder_name).exists():
-            return True
-    return False
+    sent = set()
+    try:
+        with os.scandir(sent_dir) as it:
+            buckets = [e.path for e in it if e.is_dir()]
+    except FileNotFoundError:
+        return sent
+    for bucket in buckets:
+        with os.scandir(bucket) as it:
+            sent.update(e.name for e in it)
+    return sent
 
 def choose_mode() -> str:
     """Interactive mode selection."""
@@ -134,61 +170,210 @@ def choose_mode() -> str:
         return mode_map[choice]
     die(f"Invalid choice '{choice}'. Must be 1, 2, or 3.")
 
+# errnos meaning "no hard link possible here" -> copy instead
+_NO_HARDLINK = {errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EMLINK}
+
+def _link_or_copy(name: str, sfd: int, dfd: int, src_dir: str, dst_dir: str, copied: dict, link: bool = True):
+    """
+    Hardlink name from the sfd directory into dfd, replacing an existing file;
+    copy if linking isn't possible (or link is False). copied maps
+    (st_dev, st_ino) -> dst path for multiply-linked sources already copied, so
+    their other names are linked to that copy instead of copied again.
+    """
+    if link:
+        try:
+            try:
+                os.link(name, name, src_dir_fd=sfd, dst_dir_fd=dfd, follow_symlinks=False)
+            except FileExistsError:
+                os.unlink(name, dir_fd=dfd)  # Replace existing file
+                os.link(name, name, src_dir_fd=sfd, dst_dir_fd=dfd, follow_symlinks=False)
+            return
+        except OSError as e:
+            # e.g. a volume without hard links: fall back to copy
+            if e.errno not in _NO_HARDLINK:
+                raise
+    dst_file = os.path.join(dst_dir, name)
+    st = os.stat(name, dir_fd=sfd, follow_symlinks=False)
+    key = (st.st_dev, st.st_ino) if st.st_nlink > 1 else None
+    if key in copied:
+        try:
+            try:
+                os.link(copied[key], dst_file)
+            except FileExistsError:
+                os.unlink(dst_file)
+                os.link(copied[key], dst_file)
+            return
+        except OSError:
+            pass  # destination can't hardlink either: copy
+    _fast_copy(os.path.join(src_dir, name), dst_file)
+    if key is not None:
+        copied[key] = dst_file
+
+def _reraise(err: OSError):
+    raise err
+
 def hardlink_directory(src: Path, dst: Path) -> bool:
-    """Recursively hardlink files from src to dst (directories are created, files are hardlinked)."""
+    """
+    Recursively hardlink files from src to dst (directories are created, files
+    are hardlinked). Walks with os.fwalk and links relative to directory fds,
+    so no path is resolved per file. Symlinked dirs are not followed.
+    """
+    dst_fds = {}    # rel dir -> open fd of its dst counterpart
+    pending = {}    # rel dir -> subdirs not yet visited (fd closes at 0)
+    copied = {}     # (st_dev, st_ino) -> first copy, for the copy fallback
     try:
-        # Create destination directory
-        dst.mkdir(parents=True, exist_ok=True)
-        
-        # Walk through source directory
-        for root, dirs, files in os.walk(src):
-            # Create relative path from source
-            rel_path = Path(root).relative_to(src)
-            dst_subdir = dst / rel_path
-            dst_subdir.mkdir(parents=True, exist_ok=True)
-            
-            # Hardlink all files
-            for file in files:
-                src_file = Path(root) / file
-                dst_file = dst_subdir / file
+        src_root, dst_root = str(src), str(dst)
+        os.makedirs(dst_root, exist_ok=True)
+        # Cross-volume: every link would fail with EXDEV, so go straight to copying
+        link = os.stat(src_root).st_dev == os.stat(dst_root).st_dev
+        cut = len(src_root) + 1
+        for root, dirs, files, sfd in os.fwalk(src_root, follow_symlinks=False, onerror=_reraise):
+            # fwalk lists symlinked dirs without descending into them: drop them
+            dirs[:] = [d for d in dirs
+                       if not stat.S_ISLNK(os.stat(d, dir_fd=sfd, follow_symlinks=False).st_mode)]
+            rel = root[cut:]
+            if rel:
+                parent, base = os.path.split(rel)
+                pfd = dst_fds[parent]
                 try:
-                    if dst_file.exists():
-                        dst_file.unlink()  # Remove existing file if any
-                    os.link(str(src_file), str(dst_file))
-                except OSError as e:
-                    # If hardlink fails (e.g., cross-filesystem), fall back to copy
-                    shutil.copy2(str(src_file), str(dst_file))
+                    os.mkdir(base, dir_fd=pfd)
+                except FileExistsError:
+                    pass
+                dfd = os.open(base, os.O_RDONLY | os.O_DIRECTORY, dir_fd=pfd)
+                pending[parent] -= 1
+                if not pending[parent]:
+                    os.close(dst_fds.pop(parent))
+            else:
+                dfd = os.open(dst_root, os.O_RDONLY | os.O_DIRECTORY)
+            dst_fds[rel] = dfd
+            pending[rel] = len(dirs)
+
+            dst_dir = os.path.join(dst_root, rel)
+            for name in files:
+                _link_or_copy(name, sfd, dfd, root, dst_dir, copied, link)
+            if not dirs:
+                os.close(dst_fds.pop(rel))
         return True
     except Exception as e:
         print(f"[WARN] Hardlink operation failed: {e}")
         return False
+    finally:
+        for fd in dst_fds.values():
+            os.close(fd)
+
+FICLONE = 0x40049409            # linux/fs.h: _IOW(0x94, 9, int)
+_libc = None                    # lazily loaded for clonefile(2) on macOS
+
+def _darwin_clonefile(src: Path, dst: Path) -> bool:
+    """APFS copy-on-write clone via clonefile(2) (whole trees too); dst must not exist yet."""
+    global _libc
+    if sys.platform != "darwin":
+        return False
+    try:
+        if _libc is None:
+            import ctypes
+            _libc = ctypes.CDLL(None, use_errno=True)
+        clonefile = _libc.clonefile
+    except (OSError, AttributeError):
+        return False
+    return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+COPY_CHUNK = 64 * 1024 * 1024    # per copy_file_range / sendfile call
+# errnos meaning "this kernel copy path doesn't apply to these files"
+_NO_KERNEL_COPY = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+def _kernel_copy(src_fd: int, dst_fd: int) -> bool:
+    """
+    Copy the rest of src_fd into dst_fd inside the kernel: FICLONE reflink,
+    else copy_file_range, else sendfile (Linux only; on macOS sendfile only
+    targets sockets). Returns False if none of them applies.
+    """
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError:
+        pass
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(src_fd, dst_fd, COPY_CHUNK):
+                pass
+            return True
+        except OSError as e:
+            if e.errno not in _NO_KERNEL_COPY:
+                raise
+    offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+    try:
+        while True:
+            sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK)
+            if not sent:
+                return True
+            offset += sent
+    except OSError as e:
+        if e.errno not in _NO_KERNEL_COPY:
+            raise
+        return False
+    finally:
+        os.lseek(src_fd, offset, os.SEEK_SET)
+
+def _fast_copy(src: str, dst: str) -> str:
+    """
+    copy2 replacement (copytree copy_function and the hardlink fallback): on
+    Linux the bytes never pass through userspace. macOS keeps shutil.copy2,
+    which already copies with fcopyfile(3).
+    """
+    import shutil
+    if sys.platform == "linux":
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            done = _kernel_copy(fsrc.fileno(), fdst.fileno())
+        if done:
+            shutil.copystat(src, dst)
+            return dst
+    return shutil.copy2(src, dst)
 
 def copy_directory(src: Path, dst: Path) -> bool:
-    """Copy directory using shutil.copytree."""
+    """
+    Copy directory. On APFS the whole tree is cloned copy-on-write in one
+    clonefile(2) call; otherwise shutil.copytree, reflinking files where the
+    filesystem can.
+    """
     try:
-        shutil.copytree(str(src), str(dst), dirs_exist_ok=True)
+        if not dst.exists() and _darwin_clonefile(src, dst):
+            return True
+        import shutil
+        shutil.copytree(str(src), str(dst), dirs_exist_ok=True, copy_function=_fast_copy)
         return True
     except Exception as e:
         print(f"[WARN] Copy operation failed: {e}")
         return False
 
+def _rsync(args: List[str]) -> bool:
+    """
+    Run rsync with archive mode (preserves permissions, timestamps, etc.).
+    Local copy into a fresh folder: send whole files (-W) and write them in
+    place, skipping rsync's temp-file + rename per file. stderr is streamed
+    and only its tail kept, so memory stays flat however much rsync has to say.
+    """
+    import subprocess
+    proc = subprocess.Popen(
+        ["rsync", "-a", "-W", "--inplace", *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    err_tail = deque(proc.stderr, maxlen=100)
+    proc.stderr.close()
+    if proc.wait() != 0:
+        print(f"[WARN] rsync failed: {''.join(err_tail)}")
+        return False
+    return True
+
 def rsync_directory(src: Path, dst: Path) -> bool:
     """Copy directory using rsync."""
     try:
         # Ensure destination parent exists
         dst.parent.mkdir(parents=True, exist_ok=True)
-        # Use rsync with archive mode (preserves permissions, timestamps, etc.)
-        # Copy src/ contents into dst (dst will be created if it doesn't exist)
-        result = subprocess.run(
-            ["rsync", "-a", f"{src}/", f"{dst}/"],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        if result.returncode != 0:
-            print(f"[WARN] rsync failed: {result.stderr}")
-            return False
-        return True
+        # Copy src/ contents into dst (dst will be created if it doesn't exist).
+        return _rsync([f"{src}/", f"{dst}/"])
     except FileNotFoundError:
         print("[WARN] rsync not found. Falling back to copy.")
         return copy_directory(src, dst)
@@ -196,6 +381,29 @@ def rsync_directory(src: Path, dst: Path) -> bool:
         print(f"[WARN] rsync operation failed: {e}")
         return False
 
+def rsync_folders(pairs: List[Tuple[Path, Path]]) -> bool:
+    """
+    rsync several (src, dst) folders in one run. All srcs share a parent, as do
+    all dsts, and each dst keeps its src's name; the names go to rsync through
+    --files-from (NUL-separated). A single pair is just rsync_directory.
+    """
+    if len(pairs) == 1:
+        return rsync_directory(*pairs[0])
+    import tempfile
+    src_root, dst_root = pairs[0][0].parent, pairs[0][1].parent
+    try:
+        with tempfile.NamedTemporaryFile("wb", suffix=".files") as lst:
+            lst.write(b"".join(os.fsencode(src.name) + b"\0" for src, _ in pairs))
+            lst.flush()
+            # --files-from turns off the recursion -a implies: ask for it again
+            return _rsync(["-r", "--from0", f"--files-from={lst.name}", f"{src_root}/", f"{dst_root}/"])
+    except FileNotFoundError:
+        print("[WARN] rsync not found. Falling back to copy.")
+        return all([copy_directory(src, dst) for src, dst in pairs])
+    except Exception as e:
+        print(f"[WARN] rsync operation failed: {e}")
+        return False
+
 # ------------------------ Main flow ------------------------
 
 def main():
@@ -207,7 +415,15 @@ def main():
         default=None,
         help="Transfer mode: hardlink, cp (default), or rsync. If not provided, interactive mode will prompt."
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Folders transferred at once (default: CPU count for hardlink/cp, 4 for rsync)."
+    )
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        die("--jobs must be at least 1.")
     
     # Determine mode: use --mode if provided, otherwise interactive selection
     if args.mode:
@@ -230,14 +446,15 @@ def main():
     ensure_dir(sent_dir)  # create if missing
 
     # 3) Find candidate directories to send (exclude _reports, _sent, hidden, and already-sent)
-    exclude_names = ["_reports", "_sent"]
+    exclude_names = {"_reports", "_sent"}
     all_candidates = list_top_level_dirs(base_dir, exclude_names=exclude_names)
 
     # Filter out folders that have already been sent
+    sent_names = build_sent_index(sent_dir)
     candidates = []
     already_sent = []
     for candidate in all_candidates:
-        if folder_already_sent(sent_dir, candidate.name):
+        if candidate.name in sent_names:
             already_sent.append(candidate.name)
         else:
             candidates.append(candidate)
@@ -250,12 +467,7 @@ def main():
             print("All folders have already been sent. Nothing new to package.")
         else:
             print("No folders to send. (Nothing found besides _reports/_sent.)")
-        open_finder(sent_dir)
-        url = file_request_urls.get(name)
-        if url:
-            open_safari(url)
-        else:
-            print(f"[INFO] No file_request_urls entry for {name}. Add it to config.json to auto-open Dropbox.")
+        open_finder_and_request(sent_dir, file_request_urls.get(name), name)
         sys.exit(0)
 
     # 4) Compute today's bucket name (but don't create yet)
@@ -293,17 +505,42 @@ def main():
         "rsync": "Synced"
     }[mode]
     
-    for src in candidates:
-        dst = unique_destination(bucket_path, src.name)
+    jobs = args.jobs or (4 if mode == "rsync" else (os.cpu_count() or 1))
+
+    # Reserve every destination name first (serially), then transfer folders in parallel
+    taken = set(os.listdir(bucket_path))
+    plan = [(src, unique_destination(bucket_path, src.name, taken)) for src in candidates]
+    if mode == "rsync":
+        # One rsync run per worker, each handed its share of the folders; any
+        # folder renamed in the bucket can't go by --files-from and runs alone.
+        same = [p for p in plan if p[1].name == p[0].name]
+        batches = [same[i::jobs] for i in range(min(jobs, len(same)))]
+        batches += [[p] for p in plan if p[1].name != p[0].name]
+        run = rsync_folders
+    else:
+        batches = [[p] for p in plan]
+        run = lambda batch: transfer_func(*batch[0])
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(batches))) as ex:
+        futures = {ex.submit(run, batch): batch for batch in batches}
         try:
-            success = transfer_func(src, dst)
-            if success:
-                transferred.append((src.name, dst))
-                print(f"{action_verb}: {src.name} -> {dst.relative_to(sent_dir)}")
-            else:
-                print(f"[WARN] Failed to {mode} {src} -> {dst}")
-        except Exception as e:
-            print(f"[WARN] Failed to {mode} {src} -> {dst}: {e}")
+            for fut in as_completed(futures):
+                batch = futures[fut]
+                try:
+                    success = fut.result()
+                    error = ""
+                except Exception as e:
+                    success, error = False, f": {e}"
+                for src, dst in batch:
+                    if success:
+                        transferred.append((src.name, dst))
+                        print(f"{action_verb}: {src.name} -> {dst.relative_to(sent_dir)}")
+                    else:
+                        print(f"[WARN] Failed to {mode} {src} -> {dst}{error}")
+        except BaseException:
+            # Ctrl-C: let the folders in flight finish, start no more
+            ex.shutdown(wait=True, cancel_futures=True)
+            raise
 
     if not transferred:
         print(f"[WARN] No folders were transferred (unexpected).")
@@ -311,13 +548,7 @@ def main():
         print(f"\n✅ {action_verb} {len(transferred)} folder(s) into: {bucket_path}")
 
     # 6) Open Finder at _sent and Safari at this user's File Request URL
-    #open_finder(bucket_path)
-    url = file_request_urls.get(name)
-    if url:
-        open_safari(url)
-    else:
-        print(f"[INFO] No file_request_urls entry for {name}. Add it to config.json to auto-open Dropbox.")
-    open_finder(bucket_path)
+    open_finder_and_request(bucket_path, file_request_urls.get(name), name)
     
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -20,18 +20,28 @@ Env/config used (set by launcher or shell):
                            dailies roll is resolved from config:
                              - prompts to pick a mounted SECONDARY_DAILIES_ROLL
                              - falls back to DEFAULT_DAILIES_ROLL
+  KONY_COPY_PARALLELISM -> optional, number of files copied concurrently
+                           (default 4; set 1 for a slow single-spindle HDD)
 """
 
 import os
 import re
 import sys
 import csv
+import json
+import time
+import errno
+import fcntl
 import shutil
+import struct
 import datetime
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple, List, Optional
+from typing import Dict, Iterator, Tuple, List, Optional
 
-from config_loader import load_config, resolve_dailies_roll
+from config_loader import json_loads, load_config, resolve_dailies_roll
 
 def die(msg: str, code: int = 1):
     print(f"ERROR: {msg}", file=sys.stderr)
@@ -53,56 +63,175 @@ MEDIA_POOL = MEDIA_POOL_ROOT / NAME
 DAILIES_ROLL = resolve_dailies_roll(CFG)
 
 # Get patterns from config with sensible defaults
-bin_pattern_str = CFG.get("bin_naming_pattern", r"^(?P<ymd>\d{8})_(?P<seq>\d{2})(?:_.*)?$")
 suffix_pattern_str = CFG.get("suffix_allowed_pattern", r"^[A-Za-z0-9_-]+$")
 
-BIN_PATTERN = re.compile(bin_pattern_str)
 SUFFIX_ALLOWED = re.compile(suffix_pattern_str)  # what we allow as a suffix (no spaces)
 
-# Accept optional suffix after seq, e.g. 20250906_05_ya
-BIN_PATTERN = re.compile(r"^(?P<ymd>\d{8})_(?P<seq>\d{2})(?:_.*)?$")
 SUFFIX_ALLOWED = re.compile(r"^[A-Za-z0-9_-]+$")  # what we allow as a suffix (no spaces)
 
+try:
+    COPY_PARALLELISM = max(1, int(os.getenv("KONY_COPY_PARALLELISM", "4")))
+except ValueError:
+    COPY_PARALLELISM = 4
+
 # ---------- Helpers ----------
-def is_hidden_or_metadata(p: Path) -> bool:
-    return p.name.startswith(".") or p.name.startswith("._")
+def _walk(root) -> Iterator[Tuple[str, int, str]]:
+    """
+    Yield (name, size, path) for every non-hidden file under root.
+    Iterative os.scandir walk: file type and size come from the DirEntry
+    (cached from readdir), so there is no extra stat() or Path per file.
+    Dot-entries are dropped on the name alone, before any type check: that
+    covers .DS_Store and AppleDouble "._*" files, and prunes hidden folders
+    (.Spotlight-V100, .Trashes, .fseventsd, ...) without descending into them.
+    """
+    stack = deque([os.fspath(root)])
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if name[0] == ".":
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield name, entry.stat(follow_symlinks=False).st_size, entry.path
+                except FileNotFoundError:
+                    continue
 
 def list_files_recursive(root: Path) -> List[Path]:
-    return [p for p in root.rglob("*") if p.is_file() and not is_hidden_or_metadata(p)]
+    return [Path(p) for (_name, _size, p) in _walk(root)]
+
+class PoolIndex:
+    """
+    (basename, size) -> absolute path(s) of every file instance in the pool.
+    Nearly every key has exactly one path, so that first path is stored as a
+    bare str in `single`; a list is only created in `extra` for true collisions.
+    """
+    __slots__ = ("single", "extra")
+
+    def __init__(self):
+        self.single: Dict[Tuple[str, int], str] = {}
+        self.extra: Dict[Tuple[str, int], List[str]] = {}
+
+    def add(self, key: Tuple[str, int], path: str):
+        single = self.single
+        if key in single:
+            self.extra.setdefault(key, [single[key]]).append(path)
+        else:
+            single[key] = path
+
+    def update(self, other: "PoolIndex"):
+        for key, path in other.single.items():
+            self.add(key, path)
+        for key, paths in other.extra.items():
+            for path in paths[1:]:
+                self.add(key, path)
+
+    def keys(self):
+        return self.single.keys()
+
+    def paths(self, key: Tuple[str, int]) -> List[str]:
+        return self.extra.get(key) or [self.single[key]]
+
+    def __len__(self) -> int:
+        """Number of file instances (not distinct keys)."""
+        return len(self.single) + sum(len(v) - 1 for v in self.extra.values())
 
-def index_entire_media_root(root: Path) -> Dict[Tuple[str, int], List[Path]]:
+def _index_tree(root: str) -> PoolIndex:
+    local = PoolIndex()
+    for name, size, path in _walk(root):
+        local.add((name, size), path)
+    return local
+
+def index_entire_media_root(root: Path) -> PoolIndex:
     """
     Build an index of (basename, size) -> [absolute paths] for ALL files under MEDIA_POOL_ROOT.
     Skips hidden/AppleDouble. This lets us catch dupes in any user's pool.
+    Each user's pool is walked on its own thread (directory listing on the
+    LaCie is latency-bound, and the user dirs are disjoint); paths are plain str.
     """
-    idx: Dict[Tuple[str, int], List[Path]] = {}
+    idx = PoolIndex()
     if not root.exists():
         return idx
-    for f in list_files_recursive(root):
-        try:
-            key = (f.name, f.stat().st_size)
-        except FileNotFoundError:
-            continue
-        idx.setdefault(key, []).append(f)
+    user_dirs: List[str] = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.name[0] == ".":
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                user_dirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                idx.add((entry.name, entry.stat(follow_symlinks=False).st_size), entry.path)
+    if len(user_dirs) <= 1:
+        parts = [_index_tree(d) for d in user_dirs]
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, len(user_dirs))) as ex:
+            parts = list(ex.map(_index_tree, user_dirs))
+    for part in parts:
+        idx.update(part)
     return idx
 
-def find_dups_and_uniques_against_root(src_dir: Path, root_index: Dict[Tuple[str, int], List[Path]]):
+def start_background_index(root: Path):
+    """
+    Run index_entire_media_root(root) on a daemon thread so the (slow) pool walk
+    overlaps the card scan and the suffix prompt. Returns a wait() callable that
+    joins the thread and returns the finished index (re-raising any error).
+    """
+    result: dict = {}
+
+    def work():
+        try:
+            result['index'] = index_entire_media_root(root)
+        except BaseException as e:
+            result['error'] = e
+
+    t = threading.Thread(target=work, name="media-pool-index", daemon=True)
+    t.start()
+
+    def wait() -> PoolIndex:
+        t.join()
+        if 'error' in result:
+            raise result['error']
+        return result['index']
+    return wait
+
+def find_dups_and_uniques_against_root(card_entries: List[Tuple[str, int, str]], root_index: PoolIndex):
     """
-    Compare SD card files (src_dir) against global index (MEDIA_POOL_ROOT).
+    Compare SD card files (pre-scanned (name, size, path) entries from _walk)
+    against global index (MEDIA_POOL_ROOT).
+    Membership is decided in one C-level set intersection against the index's
+    key view; the per-file loop only sorts entries into the two lists.
+    Returns dups as (name, size, path, existing_paths) and uniques as entries.
     """
+    hit_keys = root_index.keys() & {(name, size) for name, size, _p in card_entries}
     dups = []
     uniques = []
-    for f in list_files_recursive(src_dir):
-        try:
-            key = (f.name, f.stat().st_size)
-        except FileNotFoundError:
-            continue
-        if key in root_index:
-            dups.append((f, root_index[key]))
+    for entry in card_entries:
+        key = (entry[0], entry[1])
+        if key in hit_keys:
+            dups.append((entry[0], entry[1], entry[2], root_index.paths(key)))
         else:
-            uniques.append(f)
+            uniques.append(entry)
     return dups, uniques
 
+def _parse_bin_name(name: str) -> Optional[Tuple[str, int]]:
+    """
+    Parse YYYYMMDD_## or YYYYMMDD_##_<suffix> into (ymd, seq); None otherwise.
+    Plain slicing instead of a regex: this runs on every folder in the pool.
+    """
+    if len(name) < 11 or name[8] != "_" or (len(name) > 11 and name[11] != "_"):
+        return None
+    ymd, seq = name[:8], name[9:11]
+    if not (ymd.isdecimal() and seq.isdecimal()):
+        return None
+    return ymd, int(seq)
+
 def parse_existing_bins(pool: Path) -> List[Tuple[str, int, Path]]:
     """
     Return list of tuples: (ymd, seq, path) for folders matching:
@@ -114,11 +243,9 @@ def parse_existing_bins(pool: Path) -> List[Tuple[str, int, Path]]:
         return out
     for p in pool.iterdir():
         if p.is_dir():
-            m = BIN_PATTERN.match(p.name)
-            if m:
-                ymd = m.group("ymd")
-                seq = int(m.group("seq"))
-                out.append((ymd, seq, p))
+            parsed = _parse_bin_name(p.name)
+            if parsed:
+                out.append((parsed[0], parsed[1], p))
     out.sort(key=lambda t: (t[0], t[1]))
     return out
 
@@ -128,6 +255,61 @@ def suggest_next_bin_name(today: datetime.date, existing: List[Tuple[str, int, P
     next_seq = (max(todays) + 1) if todays else 1
     return f"{ymd}_{next_seq:02d}"
 
+BIN_STATS_NAME = ".bin_stats.json"   # per-bin sidecar: {"files": N, "bytes": N, "mtime": ns}
+
+def _tree_mtime(root) -> int:
+    """
+    Newest st_mtime_ns across root and every non-hidden folder below it.
+    A folder's mtime only moves when its own entries change, so this is what
+    notices a file added or removed deep inside the card's nested layout.
+    One scandir per folder and a stat per folder only, never per file.
+    """
+    newest = os.stat(root).st_mtime_ns
+    stack = deque([os.fspath(root)])
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name[0] == ".":
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                        stack.append(entry.path)
+                except FileNotFoundError:
+                    continue
+    return newest
+
+def write_bin_stats(bin_dir: Path, files: int, total_bytes: int):
+    sidecar = bin_dir / BIN_STATS_NAME
+    try:
+        # Create the sidecar before sampling mtimes: adding it bumps bin_dir's
+        # mtime, rewriting an existing file does not.
+        sidecar.touch()
+        stats = {"files": files, "bytes": total_bytes, "mtime": _tree_mtime(bin_dir)}
+        with sidecar.open("w", encoding="utf-8") as f:
+            json.dump(stats, f)
+    except OSError:
+        pass
+
+def read_bin_stats(bin_dir: Path) -> Optional[Tuple[int, int]]:
+    """
+    Return (files, bytes) from the bin's sidecar, or None if it is missing or
+    any folder in the bin has changed since it was written.
+    """
+    try:
+        with (bin_dir / BIN_STATS_NAME).open("rb") as f:
+            data = json_loads(f.read())
+        if int(data["mtime"]) != _tree_mtime(bin_dir):
+            return None
+        return int(data["files"]), int(data["bytes"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
 def pretty_size(num_bytes: int) -> str:
     units = ["B","KB","MB","GB","TB"]
     size = float(num_bytes)
@@ -138,36 +320,205 @@ def pretty_size(num_bytes: int) -> str:
     return f"{size:.1f}{units[i]}"
 
 # ---------- Copy with progress ----------
-def copy_file_with_progress(src: Path, dst: Path, total_bytes: int, progress_state: dict, bufsize: int = 8 * 1024 * 1024):
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+COPY_CHUNK = 64 * 1024 * 1024    # per copy_file_range call
+PROGRESS_INTERVAL = 0.25         # seconds between progress redraws
+
+# errnos meaning "no in-kernel copy here" -> fall back to the read/write loop
+_NO_KERNEL_COPY = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+def advance_progress(progress_state: dict, total_bytes: int, n: int):
+    """Add n copied bytes and redraw; safe to call from several copy threads."""
+    with progress_state['lock']:
+        progress_state['done_bytes'] += n
+        show_progress(progress_state, total_bytes)
+
+def show_progress(progress_state: dict, total_bytes: int, force: bool = False):
+    """
+    Redraw the progress bar, at most once per PROGRESS_INTERVAL unless forced
+    or complete. Never redraws a value that is already on screen.
+    """
+    done = progress_state['done_bytes']
+    if done == progress_state.get('drawn_bytes'):
+        return
+    now = time.monotonic()
+    if not force and done < total_bytes and now - progress_state.get('last_draw', 0.0) < PROGRESS_INTERVAL:
+        return
+    progress_state['last_draw'] = now
+    progress_state['drawn_bytes'] = done
+    pct = (done / total_bytes) * 100 if total_bytes > 0 else 100.0
+    bar_len = 30
+    filled = int(bar_len * pct / 100)
+    bar = "#" * filled + "-" * (bar_len - filled)
+    out = sys.stdout
+    out.write(f"\rCopying… [{bar}] {pct:6.2f}%  ({pretty_size(done)}/{pretty_size(total_bytes)})")
+    out.flush()
+
+FICLONE = 0x40049409            # linux/fs.h: _IOW(0x94, 9, int)
+_libc = None                    # lazily loaded for clonefile(2) on macOS
+
+def _same_volume(src: Path, dst_dir: Path) -> bool:
+    try:
+        return os.stat(src).st_dev == os.stat(dst_dir).st_dev
+    except OSError:
+        return False
+
+def _darwin_clonefile(src: Path, dst: Path) -> bool:
+    """APFS copy-on-write clone via clonefile(2); dst must not exist yet."""
+    global _libc
+    if sys.platform != "darwin":
+        return False
+    try:
+        if _libc is None:
+            import ctypes
+            _libc = ctypes.CDLL(None, use_errno=True)
+        clonefile = _libc.clonefile
+    except (OSError, AttributeError):
+        return False
+    return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+def _linux_reflink(fsrc, fdst) -> bool:
+    """Btrfs/XFS reflink of the whole file via the FICLONE ioctl."""
+    if sys.platform != "linux":
+        return False
+    try:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except OSError:
+        return False
+    return True
+
+# macOS <sys/fcntl.h>: fcntl(F_PREALLOCATE) with an fstore_t
+F_PREALLOCATE = getattr(fcntl, "F_PREALLOCATE", 42)
+F_ALLOCATECONTIG, F_ALLOCATEALL, F_PEOFPOSMODE = 0x2, 0x4, 3
+
+def _preallocate(fd: int, size: int):
+    """
+    Reserve size bytes for a new dst file in one call (contiguous if the FS can),
+    so the copy loop doesn't allocate extents chunk by chunk. Best effort.
+    """
+    if size <= 0:
+        return
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, size)
+        elif sys.platform == "darwin":
+            for flags in (F_ALLOCATECONTIG | F_ALLOCATEALL, F_ALLOCATEALL):
+                try:
+                    fcntl.fcntl(fd, F_PREALLOCATE, struct.pack("@Iiqqq", flags, F_PEOFPOSMODE, 0, size, 0))
+                    return
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+def _kernel_copy(fsrc, fdst, total_bytes: int, progress_state: dict) -> bool:
+    """
+    Copy via os.copy_file_range (in-kernel, no userspace buffer).
+    Returns False if unsupported for this pair of files; file offsets are left
+    where the kernel stopped, so the caller's read/write loop can carry on.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    while True:
+        try:
+            n = os.copy_file_range(src_fd, dst_fd, COPY_CHUNK)
+        except OSError as e:
+            if e.errno in _NO_KERNEL_COPY:
+                return False
+            raise
+        if n == 0:
+            return True
+        advance_progress(progress_state, total_bytes, n)
+
+def _sendfile_copy(fsrc, fdst, total_bytes: int, progress_state: dict) -> bool:
+    """
+    Linux fallback when copy_file_range is refused: os.sendfile still moves the
+    bytes page cache -> dst inside the kernel. Skipped on macOS, where sendfile
+    only targets sockets. Starts at (and leaves) the source's current offset.
+    """
+    if sys.platform != "linux" or not hasattr(os, "sendfile"):
+        return False
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+    try:
         while True:
-            buf = fsrc.read(bufsize)
-            if not buf:
-                break
-            fdst.write(buf)
-            progress_state['done_bytes'] += len(buf)
-            done = progress_state['done_bytes']
-            pct = (done / total_bytes) * 100 if total_bytes > 0 else 100.0
-            bar_len = 30
-            filled = int(bar_len * pct / 100)
-            bar = "#" * filled + "-" * (bar_len - filled)
-            sys.stdout.write(f"\rCopying… [{bar}] {pct:6.2f}%  ({pretty_size(done)}/{pretty_size(total_bytes)})")
-            sys.stdout.flush()
+            try:
+                sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK)
+            except OSError as e:
+                if e.errno in _NO_KERNEL_COPY:
+                    return False
+                raise
+            if sent == 0:
+                return True
+            offset += sent
+            advance_progress(progress_state, total_bytes, sent)
+    finally:
+        os.lseek(src_fd, offset, os.SEEK_SET)
+
+def _copy_loop(fsrc, fdst, total_bytes: int, progress_state: dict, bufsize: int):
+    """Userspace fallback: readinto one reused buffer, write a view of it."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    buf = bytearray(bufsize)
+    view = memoryview(buf)
+    while True:
+        n = fsrc.readinto(buf)
+        if not n:
+            break
+        fdst.write(view[:n])
+        advance_progress(progress_state, total_bytes, n)
+
+def copy_file_with_progress(src: Path, dst: Path, total_bytes: int, progress_state: dict,
+                            bufsize: int = 16 * 1024 * 1024, size: Optional[int] = None):
+    """
+    Copy one file; dst.parent must already exist (copy_selected_files creates them).
+    size (from the card scan) lets the destination be preallocated.
+    """
+    same_volume = _same_volume(src, dst.parent)
+    # Same volume: a COW clone is instant and moves no bytes
+    if same_volume and _darwin_clonefile(src, dst):
+        advance_progress(progress_state, total_bytes, src.stat().st_size)
+        return
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        if same_volume and _linux_reflink(fsrc, fdst):
+            advance_progress(progress_state, total_bytes, os.fstat(fsrc.fileno()).st_size)
+        else:
+            if size is not None:
+                _preallocate(fdst.fileno(), size)
+            if not (_kernel_copy(fsrc, fdst, total_bytes, progress_state)
+                    or _sendfile_copy(fsrc, fdst, total_bytes, progress_state)):
+                _copy_loop(fsrc, fdst, total_bytes, progress_state, bufsize)
     try:
         shutil.copystat(src, dst)
     except Exception:
         pass
 
-def copy_selected_files(src_root: Path, dst_root: Path, files: List[Path]):
+def copy_selected_files(src_root: Path, dst_root: Path, files: List[Tuple[Path, int]]):
     if dst_root.exists():
         die(f"Destination already exists: {dst_root}")
-    total_bytes = sum(f.stat().st_size for f in files if f.exists())
-    progress_state = {'done_bytes': 0}
-    for s in files:
-        rel = s.relative_to(src_root)
-        d = dst_root / rel
-        copy_file_with_progress(s, d, total_bytes, progress_state)
+    total_bytes = sum(sz for _, sz in files)
+    progress_state = {'done_bytes': 0, 'lock': threading.Lock()}
+
+    def copy_one(job: Tuple[Path, Path, int]):
+        src, dst, size = job
+        copy_file_with_progress(src, dst, total_bytes, progress_state, size=size)
+
+    # Every file has its own dst path, so order doesn't matter; a few copies in
+    # flight keep both the card read and the LaCie write busy.
+    jobs = [(s, dst_root / s.relative_to(src_root), sz) for s, sz in files]
+    # Create every destination folder up front so the copy workers only move bytes
+    for d in sorted({d.parent for _, d, _sz in jobs}):
+        d.mkdir(parents=True, exist_ok=True)
+    if COPY_PARALLELISM <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            copy_one(job)
+    else:
+        with ThreadPoolExecutor(max_workers=COPY_PARALLELISM) as ex:
+            list(ex.map(copy_one, jobs))
+    show_progress(progress_state, total_bytes, force=True)
     sys.stdout.write("\n")
     sys.stdout.flush()
 
@@ -175,19 +526,20 @@ def write_duplicate_report(media_pool_for_user: Path, roll_name: str, dups):
     """
     Write CSV under the SELECTED USER's MEDIA_POOL/_reports, but include the full
     absolute paths for where duplicates were found (across all users).
+    dups are (name, size, path, matches) from the card scan, so nothing is re-stat'ed;
+    matches are already absolute, so abspath (lexical) replaces resolve().
     """
     reports_dir = media_pool_for_user / "_reports"
     reports_dir.mkdir(parents=True, exist_ok=True)
     csv_path = reports_dir / f"duplicate_report_{roll_name}.csv"
-    with csv_path.open("w", newline="") as f:
+    rows = [
+        [name, size, path, " | ".join(os.path.abspath(m) for m in matches)]
+        for name, size, path, matches in dups
+    ]
+    with csv_path.open("w", newline="", buffering=1 << 20) as f:
         w = csv.writer(f)
         w.writerow(["source_name","source_size","source_path","existing_paths"])
-        for src, matches in dups:
-            try:
-                size = src.stat().st_size
-            except FileNotFoundError:
-                size = 0
-            w.writerow([src.name, size, str(src), " | ".join(str(m.resolve()) for m in matches)])
+        w.writerows(rows)
     return csv_path
 
 # ---------- Main ----------
@@ -205,6 +557,10 @@ def main():
     # Ensure user MEDIA_POOL exists
     MEDIA_POOL.mkdir(parents=True, exist_ok=True)
 
+    # Index ALL users under MEDIA_POOL_ROOT in the background; joined before the dup check
+    print("\nIndexing ALL media pools under MEDIA_POOL_ROOT for duplicates (in background)...")
+    wait_for_root_index = start_background_index(MEDIA_POOL_ROOT)
+
     # Show latest 3 bins for THIS user (suffix-aware)
     existing_bins = parse_existing_bins(MEDIA_POOL)
     if existing_bins:
@@ -212,22 +568,20 @@ def main():
         print("\nRecent bins (alphanumeric, newest at bottom):")
         for (_ymd, _seq, path) in last_three:
             try:
-                files = list_files_recursive(path)
-                total = sum(f.stat().st_size for f in files)
-                print(f"  • {path.name}   ({len(files)} files, {pretty_size(total)})")
+                stats = read_bin_stats(path)
+                if stats is None:
+                    sizes = [sz for (_name, sz, _p) in _walk(path)]
+                    stats = (len(sizes), sum(sizes))
+                n_files, total = stats
+                print(f"  • {path.name}   ({n_files} files, {pretty_size(total)})")
             except Exception:
                 print(f"  • {path.name}")
     else:
         print("\nNo existing YYYYMMDD_## bins found in user media_pool.")
 
-    # Index ALL users under MEDIA_POOL_ROOT
-    print("\nIndexing ALL media pools under MEDIA_POOL_ROOT for duplicates...")
-    root_index = index_entire_media_root(MEDIA_POOL_ROOT)
-    print(f"Indexed {sum(len(v) for v in root_index.values())} file instances across all users.")
-
-    # Compare SD card against global index
-    print("Scanning dailies_roll for duplicates (global check)...")
-    dups, uniques = find_dups_and_uniques_against_root(DAILIES_ROLL, root_index)
+    # Scan the card ONCE; (name, size, path) entries are reused for the dup check and the copy
+    print("\nScanning dailies_roll...")
+    card_entries = list(_walk(DAILIES_ROLL))
 
     # Suggest base folder name and ask ONLY for optional suffix
     suggestion_base = suggest_next_bin_name(datetime.date.today(), existing_bins)
@@ -249,6 +603,12 @@ def main():
     if dest.exists():
         die(f"Destination folder already exists: {dest}")
 
+    # Compare SD card against the (now complete) global index
+    root_index = wait_for_root_index()
+    print(f"\nIndexed {len(root_index)} file instances across all users.")
+    print("Checking dailies_roll for duplicates (global check)...")
+    dups, uniques = find_dups_and_uniques_against_root(card_entries, root_index)
+
     # Handle duplicates
     if dups:
         print(f"\n⚠️  Detected {len(dups)} duplicate file(s) somewhere under MEDIA_POOL_ROOT.")
@@ -261,20 +621,21 @@ def main():
                 die("No unique files to copy. Exiting.")
             to_copy = uniques
         elif choice == "2":
-            to_copy = list_files_recursive(DAILIES_ROLL)
+            to_copy = card_entries
         else:
             die("Aborted by user.")
     else:
-        to_copy = list_files_recursive(DAILIES_ROLL)
+        to_copy = card_entries
 
     # Copy only the selected set into THIS user's destination
     print(f"\nCopying {len(to_copy)} file(s):\n  {DAILIES_ROLL}\n→ {dest}\n")
-    copy_selected_files(DAILIES_ROLL, dest, to_copy)
+    copy_selected_files(DAILIES_ROLL, dest, [(Path(p), sz) for (_name, sz, p) in to_copy])
 
     # Summary
     print("✅ Copy complete.")
-    dst_files = list_files_recursive(dest)
-    dst_total = sum(f.stat().st_size for f in dst_files) if dst_files else 0
+    dst_files = list(_walk(dest))
+    dst_total = sum(sz for (_name, sz, _p) in dst_files)
+    write_bin_stats(dest, len(dst_files), dst_total)
     print(f"Files copied: {len(dst_files)}")
     print(f"Total size:   {pretty_size(dst_total)}")
     print(f"Destination:  {dest}")
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
+import fcntl
 import os
 import re
 import sys
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional
 
@@ -31,6 +35,49 @@ _ISSUE_RE = re.compile(r"(error|failed|cannot|permission denied|vanished|unreada
 _STATS_FILES_RE = re.compile(r"^Number of files:\s+([\d,]+)")
 _STATS_XFER_RE  = re.compile(r"^Number of regular files transferred:\s+([\d,]+)")
 _STATS_BYTES_RE = re.compile(r"^Total transferred file size:\s+(.+?)\s+bytes")
+# "sent 1.23G bytes  received 35 bytes  98.76M bytes/sec" (plain or --human-readable)
+_STATS_RATE_RE  = re.compile(r"^sent .* bytes\s+([\d.,]+)([KMGTP]?) bytes/sec")
+_UNIT = {"": 1, "K": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15}
+# --out-format="%i %n" line for a regular file: 2nd char of the itemize code
+# (11 chars on rsync 3, 9 on 2.6) is the type, 'f' = file; group 1 is the path
+# (never a trailing-slash dir).
+# Multiline, so one finditer() call pulls every file out of a whole block.
+_ITEM_FILE_RE = re.compile(rb"^.f\S* ([^\r\n]*[^/\r\n])\r?$", re.M)
+
+# Bigger pipe so rsync isn't stalled on a full 64 KiB buffer while we parse/log.
+# Python 3.10+, and only where the OS can resize pipes (Linux F_SETPIPE_SZ).
+_PIPE_KW = {"pipesize": 1 << 20} if sys.version_info >= (3, 10) else {}
+
+READ_CHUNK = 64 * 1024
+
+def _pipe_blocks(fd: int, tee=None):
+    """Read fd in READ_CHUNK pieces and yield runs of complete lines (bytes).
+
+    LF, CR and CRLF all end a line, as rsync separates progress updates with
+    CR. Each raw chunk is echoed to the binary stream tee first, if given.
+    """
+    pending = b""
+    while True:
+        chunk = os.read(fd, READ_CHUNK)
+        if not chunk:
+            break
+        if tee is not None:
+            tee.write(chunk)
+            tee.flush()
+        data = pending + chunk
+        # A trailing CR may be the first half of CRLF: leave it for the next chunk
+        end = len(data) - 1 if data.endswith(b"\r") else len(data)
+        cut = max(data.rfind(b"\n", 0, end), data.rfind(b"\r", 0, end)) + 1
+        pending = data[cut:]
+        if cut:
+            yield data[:cut]
+    if pending:
+        yield pending
+
+def _pipe_lines(fd: int, tee=None):
+    """Like _pipe_blocks, one line at a time (no EOL)."""
+    for block in _pipe_blocks(fd, tee):
+        yield from block.splitlines()
 
 def _format_duration(seconds: float) -> str:
     s = int(seconds)
@@ -42,31 +89,54 @@ def _format_duration(seconds: float) -> str:
         return f"{m}m {s}s"
     return f"{s}s"
 
-def run(cmd: List[str], log_path: Optional[Path] = None) -> int:
+_CHILDREN = set()                # live Popen objects, so Ctrl-C can stop them from the main thread
+_CHILDREN_LOCK = threading.Lock()
+_STOP = threading.Event()        # set on Ctrl-C: workers must not start another rsync
+
+def stop_children():
+    _STOP.set()
+    with _CHILDREN_LOCK:
+        procs = list(_CHILDREN)
+    for proc in procs:
+        try:
+            proc.terminate()
+        except OSError:
+            pass
+
+def run(cmd: List[str], log_path: Optional[Path] = None, stats: Optional[dict] = None, tee: bool = True) -> int:
     """Run a command streaming output to the terminal; write a filtered log.
 
-    The terminal sees everything (live progress included). The log file omits
+    The terminal sees everything (live progress included), unless tee is
+    False: then output goes to the log only. The log file omits
     rsync progress updates (which are pure noise once written to disk) and
     appends a SUMMARY section at the end with elapsed time, file counts, and
     any errors or warnings — so it's easy to see at a glance how the run went.
+    If stats is given, rsync's final transfer rate is stored in it as
+    "bytes_per_sec".
     """
     eprint(" ".join([f"'{c}'" if " " in c else c for c in cmd]))
     start = datetime.now()
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1,
-                            text=True, encoding="utf-8", errors="replace")
+    # Unbuffered: output is read in large chunks and echoed raw as it arrives
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0, **_PIPE_KW)
+    with _CHILDREN_LOCK:
+        _CHILDREN.add(proc)
     logf = None
     issues: List[str] = []
     files_total = files_xferred = bytes_xferred = None
     try:
         if log_path:
             log_path.parent.mkdir(parents=True, exist_ok=True)
-            logf = log_path.open("w", encoding="utf-8", newline="")
-            logf.write(f"# {start.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            logf.write(f"# cmd: {' '.join(cmd)}\n\n")
-        for line in proc.stdout:
-            print(line, end="")
+            # Binary with a 64 KiB buffer: bursts of rsync lines land in few write()s
+            logf = open(log_path, "wb", buffering=1 << 16)
+            def log(text: str):
+                logf.write(text.encode("utf-8", "replace"))
+            log(f"# {start.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            log(f"# cmd: {' '.join(cmd)}\n\n")
+        sys.stdout.flush()
+        for raw in _pipe_lines(proc.stdout.fileno(), tee=sys.stdout.buffer if tee else None):
+            line = raw.decode("utf-8", "replace") + "\n"
             if logf and not _PROGRESS_RE.match(line):
-                logf.write(line)
+                logf.write(raw + b"\n")
             if _ISSUE_RE.search(line):
                 issues.append(line.rstrip("\n"))
             m = _STATS_FILES_RE.match(line)
@@ -75,26 +145,31 @@ def run(cmd: List[str], log_path: Optional[Path] = None) -> int:
             if m: files_xferred = m.group(1)
             m = _STATS_BYTES_RE.match(line)
             if m: bytes_xferred = m.group(1).strip()
+            m = _STATS_RATE_RE.match(line)
+            if m and stats is not None:
+                stats["bytes_per_sec"] = float(m.group(1).replace(",", "")) * _UNIT[m.group(2)]
         rc = proc.wait()
         elapsed = (datetime.now() - start).total_seconds()
         if logf:
-            logf.write("\n" + "─" * 68 + "\n")
-            logf.write(f"SUMMARY  (rsync exit code: {rc})\n")
-            logf.write("─" * 68 + "\n")
-            logf.write(f"Duration:           {_format_duration(elapsed)}\n")
-            if files_total:   logf.write(f"Files in tree:      {files_total}\n")
-            if files_xferred: logf.write(f"Files transferred:  {files_xferred}\n")
-            if bytes_xferred: logf.write(f"Bytes transferred:  {bytes_xferred}\n")
-            logf.write("\nErrors / Warnings:\n")
+            log("\n" + "─" * 68 + "\n")
+            log(f"SUMMARY  (rsync exit code: {rc})\n")
+            log("─" * 68 + "\n")
+            log(f"Duration:           {_format_duration(elapsed)}\n")
+            if files_total:   log(f"Files in tree:      {files_total}\n")
+            if files_xferred: log(f"Files transferred:  {files_xferred}\n")
+            if bytes_xferred: log(f"Bytes transferred:  {bytes_xferred}\n")
+            log("\nErrors / Warnings:\n")
             if issues:
                 for line in issues:
-                    logf.write(f"  {line}\n")
+                    log(f"  {line}\n")
             else:
-                logf.write("  (none)\n")
+                log("  (none)\n")
         return rc
     finally:
+        with _CHILDREN_LOCK:
+            _CHILDREN.discard(proc)
         if logf:
-            logf.close()
+            logf.close()  # flushes the buffer, also on Ctrl-C
 
 def confirm(prompt: str, default_yes: bool = False) -> bool:
     suffix = " [Y/n]: " if default_yes else " [y/N]: "
@@ -121,12 +196,22 @@ def ensure_mounted(p: Path, label: str):
                 die(f"{label} volume not mounted: {drive_path}")
     p.parent.mkdir(parents=True, exist_ok=True)
 
+def _device_of(p: Path) -> int:
+    """st_dev of p, or of its nearest existing ancestor."""
+    for q in (p, *p.parents):
+        try:
+            return os.stat(q).st_dev
+        except FileNotFoundError:
+            continue
+    return -1
+
 def write_excludes_tempfile(excludes: List[str]) -> Path:
-    tf = tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8")
-    with tf as f:
-        for pat in excludes:
-            f.write(pat + "\n")
-    return Path(tf.name)
+    fd, name = tempfile.mkstemp(suffix=".excludes")
+    try:
+        os.write(fd, "".join(pat + "\n" for pat in excludes).encode("utf-8"))
+    finally:
+        os.close(fd)
+    return Path(name)
 
 def log_path_for(dest_root: Path, name: str, label: str) -> Path:
     rep = dest_root / "_reports" / "sync_logs"
@@ -137,20 +222,36 @@ def make_lock(root: Path) -> Path:
     return root / ".sync.lock"
 
 class _LockCtx:
+    """flock(2) on root/.sync.lock: atomic, and released by the kernel if the
+    process dies, so a crashed run never leaves a stale lock behind. The file
+    itself stays (unlinking it would let a waiter lock an orphaned inode);
+    its PID/time content is only for humans."""
     def __init__(self, root: Path):
         self.root = root
+        self.fd = None
     def __enter__(self):
         self.root.mkdir(parents=True, exist_ok=True)
         lock = make_lock(self.root)
-        if lock.exists():
-            die(f"Lock file exists: {lock}\nAnother sync may be running. If not, remove the lock and retry.")
-        lock.write_text(f"{os.getpid()}\n{datetime.now().isoformat()}\n", encoding="utf-8")
+        fd = os.open(str(lock), os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            die(f"Lock held: {lock}\nAnother sync is running on this destination.")
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n{datetime.now().isoformat()}\n".encode("utf-8"))
+        self.fd = fd
         return self
     def __exit__(self, exc_type, exc, tb):
+        if self.fd is None:
+            return
         try:
-            make_lock(self.root).unlink(missing_ok=True)
+            os.ftruncate(self.fd, 0)
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
         except Exception:
             pass
+        os.close(self.fd)
+        self.fd = None
 
 def with_lock(root: Path):
     return _LockCtx(root)
@@ -166,7 +267,9 @@ def pick_rsync_bin() -> str:
 
 RSYNC_BIN = pick_rsync_bin()
 
+@lru_cache(maxsize=4)
 def rsync_version_tuple(rsync_bin: str) -> Tuple[int, int]:
+    """(major, minor) of rsync_bin; runs `--version` once per binary, then cached."""
     try:
         out = subprocess.check_output([rsync_bin, "--version"], text=True)
         m = re.search(r"version\s+(\d+)\.(\d+)", out)
@@ -195,7 +298,8 @@ class Config:
         self.excludes = self.data.get("excludes", [])
         self.backsync_globs = self.data.get("backsync_globs", ["*.mp4", "*.MP4"])
 
-        raw_flags = self.data.get("rsync", {}).get("flags", None)
+        rsync_cfg = self.data.get("rsync", {})
+        raw_flags = rsync_cfg.get("flags", None)
         if raw_flags is None:
             # Choose sensible defaults based on rsync version if config omits flags
             major, _ = rsync_version_tuple(RSYNC_BIN)
@@ -210,6 +314,20 @@ class Config:
             else:
                 self.rsync_flags = raw_flags
 
+        # "rsync": {"compress": true | <level>} compresses file data on the wire.
+        # Off by default: it only pays when the destination is across a network
+        # (all the pools here are local volumes) and the MP4 payload doesn't compress.
+        compress = rsync_cfg.get("compress", False)
+        if compress:
+            if rsync_version_tuple(RSYNC_BIN)[0] >= 3:
+                level = 1 if compress is True else int(compress)
+                self.rsync_flags = self.rsync_flags + [
+                    "--compress", f"--compress-level={level}",
+                    "--skip-compress=mp4/MP4/mov/MOV/mxf/MXF/jpg/JPG/jpeg/png/raw/ARW",
+                ]
+            else:
+                self.rsync_flags = self.rsync_flags + ["-z"]
+
     def destination_roots_for(self, name: str) -> Tuple[Path, Path]:
         if name not in self.user_dest_roots:
             die(f"No destination root configured for user '{name}' in 'user_dest_roots'.")
@@ -218,14 +336,35 @@ class Config:
 
 # ------------------------ rsync wrappers ------------------------
 
-def rsync_copy(src: Path, dst: Path, excludes_file: Path, flags: List[str], log_file: Path) -> int:
+# Above this rate the wire isn't the bottleneck and --compress only burns CPU
+COMPRESS_MAX_RATE = 200e6
+_THROUGHPUT = {}  # (src st_dev, dst st_dev) -> bytes/sec of the last forward sync
+
+def _is_compress_flag(flag: str) -> bool:
+    """True for the flags the rsync.compress knob adds: -z (2.6) or
+    --compress / --compress-level=N / --skip-compress=... (3.x)."""
+    return flag == "-z" or flag.startswith(("--compress", "--skip-compress"))
+
+def rsync_copy(src: Path, dst: Path, excludes_file: Path, flags: List[str], log_file: Path, tee: bool = True) -> int:
     src_arg = str(src) if str(src).endswith("/") else str(src) + "/"
     dst_arg = str(dst) if str(dst).endswith("/") else str(dst) + "/"
+    devs = (_device_of(src), _device_of(dst))
+    if _THROUGHPUT.get(devs, 0) > COMPRESS_MAX_RATE:
+        flags = [f for f in flags if not _is_compress_flag(f)]
     cmd = [RSYNC_BIN] + flags + ["--exclude-from", str(excludes_file), src_arg, dst_arg]
-    return run(cmd, log_file)
-
-def rsync_list_missing_from_src_mp4_only(dst: Path, src: Path, excludes_file: Path, flags: List[str], backsync_globs: List[str]) -> Tuple[int, List[str]]:
-    """Dry-run DEST -> SOURCE to list only MP4 files missing on SOURCE (files only, no dirs)."""
+    stats = {}
+    rc = run(cmd, log_file, stats, tee)
+    if "bytes_per_sec" in stats:
+        _THROUGHPUT[devs] = stats["bytes_per_sec"]
+    return rc
+
+def rsync_list_missing_from_src_mp4_only(dst: Path, src: Path, excludes_file: Path, flags: List[str], backsync_globs: List[str]) -> Tuple[int, Optional[Path], int, List[str]]:
+    """Dry-run DEST -> SOURCE to list only MP4 files missing on SOURCE (files only, no dirs).
+
+    Paths are streamed straight into a NUL-separated --files-from list instead
+    of being held in memory. Returns (rc, list_file, count, first 10 paths);
+    list_file is None when nothing is missing, otherwise the caller removes it.
+    """
     src_arg = str(src) if str(src).endswith("/") else str(src) + "/"
     dst_arg = str(dst) if str(dst).endswith("/") else str(dst) + "/"
 
@@ -239,46 +378,49 @@ def rsync_list_missing_from_src_mp4_only(dst: Path, src: Path, excludes_file: Pa
         include_args += ["--include", g]
     include_args += ["--exclude", "*"]
 
-    # Itemized changes so we can filter to files; prune empty dirs
+    # Itemized changes so we can filter to files; prune empty dirs.
+    # -8: print names verbatim so they can be fed back through --files-from.
     cmd = [
-        RSYNC_BIN, "-an", "-i","--ignore-existing", "--prune-empty-dirs",
+        RSYNC_BIN, "-an", "-i", "-8", "--ignore-existing", "--prune-empty-dirs",
         "--out-format=%i %n", "--exclude-from", str(excludes_file)
     ] + include_args + clean_flags + [dst_arg, src_arg]
 
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-    candidates: List[str] = []
-    for line in proc.stdout:
-        line = line.rstrip("\n")
-        if not line:
-            continue
-        # itemized format: first field like ">f++++++++" or ".d..t......"
-        # second char is the file-type code: 'f' = file, 'd' = dir, 'L' = symlink, etc.
-        # separate the 11-char code from the path
-        if " " not in line:
-            continue
-        code, path = line.split(" ", 1)
-        if len(code) >= 2 and code[1] == "f":
-            # It's a file; safe to treat as missing-on-source
-            candidates.append(path)
+    fd, list_name = tempfile.mkstemp(suffix=".files")
+    list_file = Path(list_name)
+    count = 0
+    examples: List[str] = []
+    # Nobody watches this output live: read it in large chunks, parse whole lines
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0, **_PIPE_KW)
+    find_files = _ITEM_FILE_RE.finditer
+    with os.fdopen(fd, "wb") as out:
+        # Raw bytes end to end: names go into the list exactly as rsync printed them
+        for block in _pipe_blocks(proc.stdout.fileno()):
+            paths = [m.group(1) for m in find_files(block)]
+            if not paths:
+                continue
+            out.write(b"\0".join(paths) + b"\0")
+            if len(examples) < 10:
+                examples += [os.fsdecode(p) for p in paths[:10 - len(examples)]]
+            count += len(paths)
     rc = proc.wait()
-    if rc != 0:
-        return rc, []
-    # Final guard: drop any trailing-slash items just in case
-    candidates = [p for p in candidates if not p.endswith("/")]
-    return 0, candidates
+    if rc != 0 or not count:
+        list_file.unlink(missing_ok=True)
+        return rc, None, 0, []
+    return 0, list_file, count, examples
+
+def rsync_copy_missing_mp4s_to_src(dst: Path, src: Path, list_file: Path, flags: List[str], log_file: Path) -> int:
+    """Copy from DEST -> SOURCE only the MP4s the dry-run listed as missing on SOURCE.
 
-def rsync_copy_missing_mp4s_to_src(dst: Path, src: Path, excludes_file: Path, flags: List[str], backsync_globs: List[str], log_file: Path) -> int:
-    """Copy from DEST -> SOURCE only for MP4s missing on SOURCE."""
+    rsync stats just the listed paths (--files-from) instead of walking DEST again.
+    """
     src_arg = str(src) if str(src).endswith("/") else str(src) + "/"
     dst_arg = str(dst) if str(dst).endswith("/") else str(dst) + "/"
 
-    include_args = ["--include", "*/"]
-    for g in backsync_globs:
-        include_args += ["--include", g]
-    include_args += ["--exclude", "*"]
-
-    cmd = [RSYNC_BIN] + flags + ["--ignore-existing", "--exclude-from", str(excludes_file)]
-    cmd += include_args + [dst_arg, src_arg]
+    # Every file here is new on SOURCE (--ignore-existing): write it in place
+    # rather than to a temp file that is then renamed over.
+    inplace = [] if "--delay-updates" in flags else ["--inplace"]
+    cmd = [RSYNC_BIN] + flags + inplace + ["--ignore-existing", "--from0", f"--files-from={list_file}"]
+    cmd += [dst_arg, src_arg]
     return run(cmd, log_file)
 
 # ------------------------ Interaction ------------------------
@@ -315,42 +457,105 @@ def choose_menu(name: str) -> int:
 
 # ------------------------ Sync flow ------------------------
 
-def sync_pair_forward_then_optional_back(cfg: Config, name: str, src: Path, dst: Path, excludes_file: Path, flags: List[str], label: str):
-    """Forward sync SRC -> DST, then MP4-only back-sync prompt."""
+def sync_pair_forward(cfg: Config, name: str, src: Path, dst: Path, excludes_file: Path, flags: List[str], label: str, tee: bool = True) -> bool:
+    """Forward sync SRC -> DST. Returns True if DST was empty beforehand."""
     ensure_mounted(src, "Source")
     ensure_mounted(dst, "Destination")
     dst.mkdir(parents=True, exist_ok=True)
+    # An empty DEST (bar our lock) can only end up holding what the forward sync copies
+    with os.scandir(dst) as it:
+        fresh = all(e.name == make_lock(dst).name for e in it)
 
     log_fwd = log_path_for(dst if label.endswith("_all") else dst.parent, name, f"{label}_forward")
     banner(f"Forward sync: {label}", [(src, dst)])
-    rc = rsync_copy(src, dst, excludes_file, flags, log_fwd)
+    rc = rsync_copy(src, dst, excludes_file, flags, log_fwd, tee)
     if rc != 0:
         eprint(f"[WARN] rsync forward exited with code {rc}. See log: {log_fwd}")
+    return fresh
+
+def sync_pair_back(cfg: Config, name: str, src: Path, dst: Path, excludes_file: Path, flags: List[str], label: str, fresh: bool):
+    """MP4-only back-sync prompt for a pair whose forward sync has finished."""
+    if fresh:
+        print(f"\n[{label}] Destination was empty before this sync: nothing can be missing on source. Back-sync not needed.")
+        return
 
     # MP4-only back-sync detection
-    print("\nScanning destination for MP4 files missing on source (dry-run)…")
-    rc2, missing = rsync_list_missing_from_src_mp4_only(dst, src, excludes_file, flags, cfg.backsync_globs)
+    print(f"\n[{label}] Scanning destination for MP4 files missing on source (dry-run)…")
+    rc2, list_file, n_missing, examples = rsync_list_missing_from_src_mp4_only(dst, src, excludes_file, flags, cfg.backsync_globs)
     if rc2 != 0:
         eprint(f"[WARN] rsync dry-run (dest→src) exited with code {rc2}; skipping back-sync detection.")
-        missing = []
-
-    if missing:
-        print(f"Found {len(missing)} MP4 file(s) present only on DEST. Example(s):")
-        for i, m in enumerate(missing[:10], 1):
-            print(f"  {i}. {m}")
-        if len(missing) > 10:
-            print(f"  … (+{len(missing)-10} more)")
-        if confirm("Back-sync DEST-only MP4s to SOURCE?", default_yes=False):
-            log_back = log_path_for(dst if label.endswith("_all") else dst.parent, name, f"{label}_backsync_mp4")
-            print("\nBack-syncing MP4s DEST → SOURCE…")
-            rc3 = rsync_copy_missing_mp4s_to_src(dst, src, excludes_file, flags, cfg.backsync_globs, log_back)
-            if rc3 != 0:
-                eprint(f"[WARN] rsync back-sync exited with code {rc3}. See log: {log_back}")
-        else:
-            print("Skipped back-sync.")
+
+    if list_file:
+        try:
+            print(f"\n[{label}] Found {n_missing} MP4 file(s) present only on DEST. Example(s):")
+            for i, m in enumerate(examples, 1):
+                print(f"  {i}. {m}")
+            if n_missing > 10:
+                print(f"  … (+{n_missing-10} more)")
+            if confirm("Back-sync DEST-only MP4s to SOURCE?", default_yes=False):
+                log_back = log_path_for(dst if label.endswith("_all") else dst.parent, name, f"{label}_backsync_mp4")
+                print("\nBack-syncing MP4s DEST → SOURCE…")
+                rc3 = rsync_copy_missing_mp4s_to_src(dst, src, list_file, flags, log_back)
+                if rc3 != 0:
+                    eprint(f"[WARN] rsync back-sync exited with code {rc3}. See log: {log_back}")
+            else:
+                print("Skipped back-sync.")
+        finally:
+            list_file.unlink(missing_ok=True)
     else:
         print("No DEST-only MP4s found. Back-sync not needed.")
 
+def sync_pair_forward_then_optional_back(cfg: Config, name: str, src: Path, dst: Path, excludes_file: Path, flags: List[str], label: str):
+    """Forward sync SRC -> DST, then MP4-only back-sync prompt."""
+    fresh = sync_pair_forward(cfg, name, src, dst, excludes_file, flags, label)
+    sync_pair_back(cfg, name, src, dst, excludes_file, flags, label, fresh)
+
+def sync_pairs_concurrently(cfg: Config, name: str, groups: List[List[Tuple[Path, Path, str]]], excludes_file: Path, flags: List[str]):
+    """Run each group's forward syncs on its own thread, then back-sync serially.
+
+    Forward rsyncs log only (no terminal tee) so concurrent progress output
+    can't garble anything; the dry-runs and prompts run afterwards on the
+    main thread, one pair at a time. Ctrl-C stops every running rsync and
+    keeps the workers from starting another.
+    """
+    def run_group(group):
+        done = []
+        for src, dst, label in group:
+            if _STOP.is_set():
+                break
+            done.append((src, dst, label, sync_pair_forward(cfg, name, src, dst, excludes_file, flags, label, tee=False)))
+        return done
+
+    print(f"\nRunning {len(groups)} forward syncs side by side; progress goes to the logs only.")
+    ex = ThreadPoolExecutor(max_workers=len(groups))
+    futures = [ex.submit(run_group, g) for g in groups]
+    try:
+        forwarded = [p for fut in futures for p in fut.result()]
+    except BaseException:
+        for fut in futures:
+            fut.cancel()
+        stop_children()
+        raise
+    finally:
+        ex.shutdown(wait=True)
+    print("\nAll forward syncs finished.")
+    for src, dst, label, fresh in forwarded:
+        sync_pair_back(cfg, name, src, dst, excludes_file, flags, label, fresh)
+
+def group_by_devices(pairs: List[Tuple[Path, Path, str]]) -> List[List[Tuple[Path, Path, str]]]:
+    """Split pairs into groups that share no device (src or dst) with any other group."""
+    groups: List[Tuple[set, list]] = []
+    for pair in pairs:
+        devs = {_device_of(pair[0]), _device_of(pair[1])}
+        merged = [g for g in groups if g[0] & devs]
+        for g in merged:
+            groups.remove(g)
+            devs |= g[0]
+        members = [p for g in merged for p in g[1]] + [pair]
+        groups.append((devs, members))
+    # keep the menu's pair order within and across groups
+    return sorted((sorted(m, key=pairs.index) for _, m in groups), key=lambda m: pairs.index(m[0]))
+
 # ------------------------ Main ------------------------
 
 def main():
@@ -412,8 +617,14 @@ def main():
             for ctx in lock_ctxs:
                 ctx.__enter__()
             try:
-                for src, dst, label in pairs:
-                    sync_pair_forward_then_optional_back(cfg, name, src, dst, excludes_file, cfg.rsync_flags, label)
+                groups = group_by_devices(pairs)
+                if len(groups) == 1:
+                    for src, dst, label in pairs:
+                        sync_pair_forward_then_optional_back(cfg, name, src, dst, excludes_file, cfg.rsync_flags, label)
+                else:
+                    # Pairs on disjoint volumes don't compete for the same disks: run those
+                    # groups side by side (pairs within a group still go one after another)
+                    sync_pairs_concurrently(cfg, name, groups, excludes_file, cfg.rsync_flags)
             finally:
                 for ctx in reversed(lock_ctxs):
                     ctx.__exit__(None, None, None)
@@ -15,9 +15,13 @@ Config (JSON):
 
 import os
 import sys
+import time
+import errno
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 from config_loader import load_config, resolve_dailies_roll
 
@@ -38,22 +42,48 @@ def pick_user(keymap: dict) -> str:
             return keymap[choice]
         print("Invalid choice. Try again.")
 
-def is_hidden_or_metadata(p: Path) -> bool:
-    return p.name.startswith(".") or p.name.startswith("._")
+# macOS volume bookkeeping: never holds footage, safe to skip without a look
+_JUNK_DIRS = {".Spotlight-V100", ".Trashes", ".fseventsd", ".TemporaryItems"}
+
+def _walk(root) -> Iterator[Tuple[str, int, str]]:
+    """
+    Yield (name, size, path) for every non-hidden file under root.
+    Iterative os.scandir walk: file type and size come from the DirEntry
+    (cached from readdir), so there is no extra stat() or Path per file.
+    Dot-files (.DS_Store, AppleDouble "._*") are dropped on the name alone.
+    Hidden folders are still walked, since whatever is in them gets wiped
+    too; only the macOS junk folders in _JUNK_DIRS are pruned.
+    """
+    stack = deque([os.fspath(root)])
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                try:
+                    if name[0] == ".":
+                        if name not in _JUNK_DIRS and entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield name, entry.stat(follow_symlinks=False).st_size, entry.path
+                except FileNotFoundError:
+                    continue
 
 def list_files_recursive(root: Path) -> List[Path]:
-    return [p for p in root.rglob("*") if p.is_file() and not is_hidden_or_metadata(p)]
+    return [Path(p) for (_name, _size, p) in _walk(root)]
 
 def index_media_root(root: Path) -> Dict[Tuple[str, int], List[Path]]:
     idx: Dict[Tuple[str, int], List[Path]] = {}
     if not root.exists():
         return idx
-    for f in list_files_recursive(root):
-        try:
-            key = (f.name, f.stat().st_size)
-        except FileNotFoundError:
-            continue
-        idx.setdefault(key, []).append(f)
+    for name, size, path in _walk(root):
+        idx.setdefault((name, size), []).append(Path(path))
     return idx
 
 def pretty_size(num_bytes: int) -> str:
@@ -65,21 +95,80 @@ def pretty_size(num_bytes: int) -> str:
         i += 1
     return f"{size:.1f}{units[i]}"
 
-def copy_with_progress(srcs: List[Path], dst_dir: Path):
+COPY_CHUNK = 64 * 1024 * 1024    # per copy_file_range call
+PROGRESS_INTERVAL = 0.25         # seconds between progress redraws
+
+# errnos meaning "no in-kernel copy here" -> fall back to the read/write loop
+_NO_KERNEL_COPY = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+def copy_with_progress(srcs: List[Tuple[Path, int]], dst_dir: Path):
     dst_dir.mkdir(parents=True, exist_ok=True)
-    total = sum(p.stat().st_size for p in srcs if p.exists())
+    total = sum(sz for _, sz in srcs)
     done = 0
+    drawn = -1
+    last_draw = 0.0
     bar_len = 30
+    out = sys.stdout
 
-    def show():
+    def show(force: bool = False):
+        # At most one redraw per PROGRESS_INTERVAL (always when forced/complete),
+        # and never the same value twice.
+        nonlocal drawn, last_draw
+        if done == drawn:
+            return
+        now = time.monotonic()
+        if not force and done < total and now - last_draw < PROGRESS_INTERVAL:
+            return
+        drawn, last_draw = done, now
         pct = (done / total) * 100 if total else 100.0
         filled = int(bar_len * pct / 100)
         bar = "#" * filled + "-" * (bar_len - filled)
-        sys.stdout.write(f"\rCopying… [{bar}] {pct:6.2f}%  ({pretty_size(done)}/{pretty_size(total)})")
-        sys.stdout.flush()
+        out.write(f"\rCopying… [{bar}] {pct:6.2f}%  ({pretty_size(done)}/{pretty_size(total)})")
+        out.flush()
+
+    def kernel_copy(fi, fo) -> bool:
+        # os.copy_file_range: in-kernel copy; False -> use the read/write loop
+        nonlocal done
+        if not hasattr(os, "copy_file_range"):
+            return False
+        while True:
+            try:
+                n = os.copy_file_range(fi.fileno(), fo.fileno(), COPY_CHUNK)
+            except OSError as e:
+                if e.errno in _NO_KERNEL_COPY:
+                    return False
+                raise
+            if n == 0:
+                return True
+            done += n
+            show()
+
+    def sendfile_copy(fi, fo) -> bool:
+        # Linux only (macOS sendfile targets sockets): kernel copy from the page cache
+        nonlocal done
+        if sys.platform != "linux" or not hasattr(os, "sendfile"):
+            return False
+        offset = os.lseek(fi.fileno(), 0, os.SEEK_CUR)
+        try:
+            while True:
+                try:
+                    sent = os.sendfile(fo.fileno(), fi.fileno(), offset, COPY_CHUNK)
+                except OSError as e:
+                    if e.errno in _NO_KERNEL_COPY:
+                        return False
+                    raise
+                if sent == 0:
+                    return True
+                offset += sent
+                done += sent
+                show()
+        finally:
+            os.lseek(fi.fileno(), offset, os.SEEK_SET)
 
-    show()
-    for s in srcs:
+    show(force=True)
+    buf = bytearray(16 * 1024 * 1024)
+    view = memoryview(buf)
+    for s, _sz in srcs:
         target = dst_dir / s.name
         if target.exists():
             stem, suf = target.stem, target.suffix
@@ -91,28 +180,57 @@ def copy_with_progress(srcs: List[Path], dst_dir: Path):
                     break
                 i += 1
         with s.open("rb") as fi, target.open("wb") as fo:
-            while True:
-                buf = fi.read(8 * 1024 * 1024)
-                if not buf:
-                    break
-                fo.write(buf)
-                done += len(buf)  # type: ignore
-                show()
+            if not (kernel_copy(fi, fo) or sendfile_copy(fi, fo)):
+                while True:
+                    n = fi.readinto(buf)
+                    if not n:
+                        break
+                    fo.write(view[:n])
+                    done += n
+                    show()
         try:
             shutil.copystat(s, target)
         except Exception:
             pass
-    sys.stdout.write("\n"); sys.stdout.flush()
+    show(force=True)
+    out.write("\n"); out.flush()
 
 def wipe_directory_contents(root: Path):
-    for p in root.iterdir():
+    """
+    Delete everything inside root. Top-level folders are removed in parallel
+    (rmtree is I/O-bound on the card); files are unlinked directly. Failures
+    are collected and reported once at the end.
+    """
+    dirs: List[str] = []
+    files: List[str] = []
+    with os.scandir(root) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            (dirs if is_dir else files).append(entry.path)
+
+    failures: List[Tuple[str, Exception]] = []
+    for path in files:
         try:
-            if p.is_dir():
-                shutil.rmtree(p)
-            else:
-                p.unlink()
+            os.unlink(path)
         except Exception as e:
-            print(f"⚠️  Could not remove {p}: {e}")
+            failures.append((path, e))
+
+    def remove_tree(path: str):
+        try:
+            shutil.rmtree(path)
+        except Exception as e:
+            return path, e
+        return None
+
+    if dirs:
+        with ThreadPoolExecutor(max_workers=min(4, len(dirs))) as ex:
+            failures.extend(f for f in ex.map(remove_tree, dirs) if f)
+
+    for path, e in failures:
+        print(f"⚠️  Could not remove {path}: {e}")
 
 # ---------------- Main ----------------
 def main():
@@ -144,11 +262,12 @@ def main():
     if not DAILIES_ROLL.is_dir():
         die(f"DAILIES_ROLL is not a folder: {DAILIES_ROLL}")
 
-    card_files = list_files_recursive(DAILIES_ROLL)
+    # Scan the card ONCE; (path, size) pairs are reused below
+    card_files = [(Path(p), sz) for (_name, sz, p) in _walk(DAILIES_ROLL)]
     if not card_files:
         die("No files found on the card (after skipping hidden/metadata).")
 
-    total_card = sum(p.stat().st_size for p in card_files)
+    total_card = sum(sz for _, sz in card_files)
     print(f"\nCard contains {len(card_files)} files, {pretty_size(total_card)}.")
 
     print("\nIndexing MEDIA_POOL_ROOT (all users)…")
@@ -156,22 +275,18 @@ def main():
     print(f"Indexed {sum(len(v) for v in root_index.values())} file instances under media pool.")
 
     missing, present = [], []
-    for f in card_files:
-        try:
-            key = (f.name, f.stat().st_size)
-        except FileNotFoundError:
-            continue
-        if key in root_index:
-            present.append(f)
+    for f, sz in card_files:
+        if (f.name, sz) in root_index:
+            present.append((f, sz))
         else:
-            missing.append(f)
+            missing.append((f, sz))
 
     print("\n=== Summary ===")
     print(f"Present in media pool: {len(present)}")
     print(f"Missing from pool:     {len(missing)}")
 
     if missing:
-        miss_size = sum(p.stat().st_size for p in missing)
+        miss_size = sum(sz for _, sz in missing)
         print(f"Missing total size:    {pretty_size(miss_size)}")
 
         orphan_dir = MEDIA_POOL_ROOT / NAME / "_orphan"
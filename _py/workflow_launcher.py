@@ -8,6 +8,7 @@ Suffix-aware newest bin detection: matches YYYYMMDD_## and YYYYMMDD_##_<suffix>.
 
 import os
 import re
+import shutil
 import sys
 import subprocess
 from pathlib import Path
@@ -18,6 +19,15 @@ from config_loader import load_config
 # suffix-aware: 20250906_04 or 20250906_04_ya
 BIN_PATTERN = re.compile(r"^(?P<ymd>\d{8})_(?P<seq>\d{2})(?:_.*)?$")
 
+def _parse_bin(name: str) -> Optional[Tuple[str, int]]:
+    """(ymd, seq) if name has BIN_PATTERN's shape, else None — slicing instead of the regex."""
+    if len(name) < 11 or name[8] != "_" or (len(name) > 11 and name[11] != "_"):
+        return None
+    ymd, seq = name[:8], name[9:11]
+    if not (ymd.isdecimal() and seq.isdecimal()):  # isdecimal == regex \d
+        return None
+    return ymd, int(seq)
+
 def die(msg: str, code: int = 1):
     print(f"ERROR: {msg}", file=sys.stderr); sys.exit(code)
 
@@ -34,18 +44,19 @@ def pick_user(keymap: dict) -> str:
         print("Invalid choice. Try again.")
 
 def newest_bin(media_pool: Path) -> Optional[Path]:
-    if not media_pool.exists():
-        return None
     candidates: List[Tuple[str, int, Path]] = []
-    for p in media_pool.iterdir():
-        if p.is_dir():
-            m = BIN_PATTERN.match(p.name)
-            if m:
-                candidates.append((m.group("ymd"), int(m.group("seq")), p))
+    try:
+        with os.scandir(media_pool) as it:
+            for e in it:
+                parsed = _parse_bin(e.name)
+                # d_type answers is_dir without a stat (symlinked bins still get one)
+                if parsed and e.is_dir():
+                    candidates.append((parsed[0], parsed[1], Path(e.path)))
+    except (FileNotFoundError, NotADirectoryError):  # missing pool, as exists() was
+        return None
     if not candidates:
         return None
-    candidates.sort(key=lambda t: (t[0], t[1]))  # ascending by date then seq
-    return candidates[-1][2]
+    return max(candidates, key=lambda t: (t[0], t[1]))[2]  # latest date, then highest seq
 
 def confirm(prompt: str, default_yes: bool = True) -> bool:
     resp = input(prompt + (" [Y/n]: " if default_yes else " [y/N]: ")).strip().lower()
@@ -98,7 +109,9 @@ def main():
     if "DEFAULT_DAILIES_ROLL" not in cfg:
         die("Config missing 'DEFAULT_DAILIES_ROLL' key.")
 
-    python_exec = cfg["python_exec"]
+    # Absolute interpreter path + close_fds=False below let subprocess use
+    # posix_spawn (vfork-style) instead of fork+exec for each child script.
+    python_exec = shutil.which(cfg["python_exec"]) or cfg["python_exec"]
     dailies_roll = Path(cfg["DEFAULT_DAILIES_ROLL"])
 
     keymap = cfg.get("user_keymap", {})
@@ -148,7 +161,7 @@ def main():
         ingest_cmd = [python_exec, str(ingest_script)]
         print(f"\n— Running ingest: {' '.join(ingest_cmd)}")
         try:
-            subprocess.run(ingest_cmd, check=True, env=env)
+            subprocess.run(ingest_cmd, check=True, env=env, close_fds=False)
         except subprocess.CalledProcessError as e:
             die(f"Ingest failed with exit code {e.returncode}")
         print("\n✅ Ingest finished.")
@@ -170,7 +183,7 @@ def main():
     for folder in folders_to_import:
         import_cmd = [python_exec, str(import_script), str(folder)]
         print(f"\n— Running import: {' '.join(import_cmd)}")
-        result = subprocess.run(import_cmd, env=env)
+        result = subprocess.run(import_cmd, env=env, close_fds=False)
         if result.returncode != 0:
             print(f"  WARNING: Import returned exit code {result.returncode} for {folder} — continuing.")
 